@@ -0,0 +1,211 @@
+"""Benchmark do pipeline de dados e gráficos do painel
+
+Gera checklists sintéticos (muitos hospitais e ciclos), mede o tempo e o
+pico de memória de cada etapa e grava um relatório JSON comparável entre
+versões:
+
+    python -m benchmarks.bench_pipeline --sizes 1000 100000 --output bench.json
+    python -m benchmarks.bench_pipeline --compare bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from igsest.charts import create_overview_charts, create_priority_chart
+from igsest.cube import MetricsCube
+from igsest.datasource import read_checklist
+from igsest.export import write_excel
+from igsest.filters import FilterIndex
+from igsest.matrix import StatusMatrix
+from igsest.metrics import calculate_metrics
+from igsest.ranking import NetworkRanking
+from igsest.scoring import WeightedScores, WeightProfile
+from igsest.shared import SHARED_DIR, open_shared
+from igsest.simulation import RemediationPlan
+from igsest.store import ComplianceStore
+from igsest.trends import cycle_rates, trend_table
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5]
+CYCLES = ['2021', '2022', '2023', '2024', '2025']
+
+
+def synthetic_checklist(rows, cycles=CYCLES, max_hospitals=200, seed=0):
+    """Checklist sintético com ~``rows`` linhas, por (hospital, ciclo)
+
+    Até ``max_hospitals`` hospitais; acima disso cada partição repete o
+    checklist embarcado quantas vezes for preciso.
+    """
+    rng = np.random.default_rng(seed)
+    base = read_checklist()
+    n_hospitals = min(max_hospitals, max(1, round(rows / (len(base) * len(cycles)))))
+    per_partition = max(len(base), round(rows / (n_hospitals * len(cycles))))
+    rows_index = np.resize(np.arange(len(base)), per_partition)
+
+    partitions = {}
+    for h in range(n_hospitals):
+        for ciclo in cycles:
+            part = base.iloc[rows_index].reset_index(drop=True)
+            part['status'] = pd.Categorical.from_codes(
+                rng.integers(0, 2, len(part)), dtype=base['status'].dtype
+            )
+            partitions[(f"H{h:04d}", ciclo)] = part
+    return partitions
+
+
+def _measure(fn, repeat, memory, setup=None):
+    """Melhor tempo de ``repeat`` execuções e pico de memória de uma delas
+
+    ``setup`` roda antes de cada execução, fora da medição.
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, best, peak
+
+
+def run_size(rows, repeat=3, memory=True, export_max_rows=10 ** 5):
+    partitions = synthetic_checklist(rows)
+    results = []
+
+    def record(stage, fn, setup=None, **extra):
+        value, seconds, peak = _measure(fn, repeat, memory, setup)
+        results.append({'stage': stage, 'seconds': seconds, 'peak_bytes': peak, **extra})
+        return value
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ComplianceStore(root)
+        store.write_partitions(partitions)
+
+        df = record('load_data', store.read)
+        # Publicar grava os arquivos da versão, uma vez por versão; mapear a
+        # versão já publicada é o que cada processo paga ao abri-la
+        versao = store.version()
+        shared_dir = os.path.join(root, SHARED_DIR)
+        record(
+            'publish_shared', lambda: open_shared(store, versao),
+            setup=lambda: shutil.rmtree(shared_dir, ignore_errors=True)
+        )
+        _, compact, _ = record('map_shared', lambda: open_shared(store, versao))
+        cube = record('build_cube', lambda: MetricsCube.from_rows(df))
+        record('calculate_metrics', lambda: calculate_metrics(cube))
+
+        index = record('build_filter_index', lambda: FilterIndex(df))
+        selection = {
+            'dimensão': index.options('dimensão')[:3],
+            'status': ['Não Conforme'],
+            'prioridade': index.options('prioridade'),
+        }
+        record('filter', lambda: index.filter(df, **selection))
+
+        cube_filtered = cube.select(**selection)
+        record('create_overview_charts', lambda: create_overview_charts(cube_filtered))
+        record('create_priority_chart', lambda: create_priority_chart(cube_filtered))
+        record('trend_by_hospital', lambda: trend_table(cycle_rates(cube, 'hospital')))
+        ranking = record('network_ranking', lambda: NetworkRanking(cube, CYCLES[-1]))
+        record('ranking_top_k', lambda: (ranking.top(10), ranking.top(10, worst=True)))
+        record('weighted_scores', lambda: WeightedScores(cube).by_hospital(WeightProfile(), CYCLES[-1]))
+        matrix = record('status_matrix', lambda: StatusMatrix.from_compact(compact))
+        record('question_cooccurrence', lambda: matrix.cooccurring_pairs(10, ciclos=[CYCLES[-1]]))
+        plan = record('remediation_plan', lambda: RemediationPlan(cube, df))
+        record('remediation_toggle', lambda: (plan.set_resolved(plan.candidates()[:10]), plan.set_resolved([])))
+
+        if len(df) <= export_max_rows:
+            target = os.path.join(root, 'relatorio.xlsx')
+            record('export_to_excel', lambda: write_excel(df, cube, target))
+
+    for r in results:
+        r.update(rows=len(df), hospitals=len({h for h, _ in partitions}), cycles=len(CYCLES))
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline, threshold):
+    """Lista as etapas que ficaram mais lentas que ``threshold`` (ex.: 0.2 = 20%)"""
+    previous = {(r['rows'], r['stage']): r['seconds'] for r in baseline['results']}
+    regressions = []
+    for r in report['results']:
+        old = previous.get((r['rows'], r['stage']))
+        if old:
+            ratio = r['seconds'] / old
+            print(f"{r['rows']:>10} {r['stage']:<24} {old:10.4f}s -> {r['seconds']:10.4f}s  x{ratio:.2f}")
+            if ratio > 1 + threshold:
+                regressions.append(r)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="número aproximado de linhas de cada conjunto sintético")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help="não mede o pico de memória")
+    parser.add_argument('--export-max-rows', type=int, default=10 ** 5,
+                        help="pula a exportação Excel acima deste número de linhas")
+    parser.add_argument('--output', help="arquivo JSON do relatório")
+    parser.add_argument('--compare', help="relatório anterior para comparação")
+    parser.add_argument('--threshold', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    report = {
+        'revision': _git_revision(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'results': [],
+    }
+    for size in args.sizes:
+        for r in run_size(size, args.repeat, not args.no_memory, args.export_max_rows):
+            report['results'].append(r)
+            peak = '' if r['peak_bytes'] is None else f"{r['peak_bytes'] / 2 ** 20:10.1f} MiB"
+            print(f"{r['rows']:>10} {r['stage']:<24} {r['seconds']:10.4f}s {peak}", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} etapa(s) mais lentas que o limite de {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
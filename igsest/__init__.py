@@ -0,0 +1 @@
+"""Biblioteca de apoio ao Painel IG-SEST."""
@@ -0,0 +1,281 @@
+"""API HTTP/JSON somente leitura sobre os dados de conformidade
+
+Servidor assíncrono só com a biblioteca padrão (asyncio): cada conexão é uma
+tarefa, com keep-alive, e os cálculos rodam em threads para não travar o
+laço. As respostas são guardadas por versão dos dados e levam um ETag; um
+``If-None-Match`` igual recebe 304 sem recalcular nada.
+
+    python -m igsest.api --porta 8765
+
+Rotas (filtros opcionais, repetidos ou separados por vírgula: ``hospital``,
+``ciclo``, ``dimensao``, ``fonte``, ``status``, ``prioridade``):
+
+    GET /versao
+    GET /metricas?hospital=MEJC-UFRN&ciclo=2025
+    GET /dimensoes?status=Não+Conforme
+    GET /questoes?prioridade=Alta&pagina=1&tamanho=100
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import traceback
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from igsest.figcache import filter_key
+from igsest.lru import LRUCache
+from igsest.metrics import calculate_metrics
+from igsest.schema import PLAIN_LABELS
+from igsest.store import DEFAULT_ROOT, open_store
+from igsest.versions import DataVersions
+
+# Parâmetro da URL -> chave interna
+FILTER_PARAMS = {
+    'hospital': 'hospital',
+    'ciclo': 'ciclo',
+    'dimensao': 'dimensão',
+    'fonte': 'fonte',
+    'status': 'status',
+    'prioridade': 'prioridade',
+}
+
+MAX_PAGE_SIZE = 1000
+IDLE_TIMEOUT = 15
+MAX_HEADER_LINES = 100
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def parse_filters(query):
+    """Filtros da query string; ``None`` para os que não vieram"""
+    params = parse_qs(query, keep_blank_values=False)
+    unknown = set(params) - set(FILTER_PARAMS) - {'pagina', 'tamanho'}
+    if unknown:
+        raise BadRequest(f"Parâmetros desconhecidos: {', '.join(sorted(unknown))}")
+    filters = {}
+    for param, key in FILTER_PARAMS.items():
+        if param in params:
+            filters[key] = [v for value in params[param] for v in value.split(',') if v]
+        else:
+            filters[key] = None
+    return filters, params
+
+
+def parse_page(params):
+    """Página e tamanho de página pedidos, validados"""
+    return {
+        'pagina': _int_param(params, 'pagina', 1, 10 ** 9),
+        'tamanho': _int_param(params, 'tamanho', 100, MAX_PAGE_SIZE),
+    }
+
+
+def _int_param(params, name, default, maximum):
+    try:
+        value = int(params.get(name, [default])[0])
+    except ValueError:
+        raise BadRequest(f"'{name}' deve ser um inteiro") from None
+    if not 1 <= value <= maximum:
+        raise BadRequest(f"'{name}' deve estar entre 1 e {maximum}")
+    return value
+
+
+def _plain(name):
+    return PLAIN_LABELS.get(name, name)
+
+
+class ComplianceAPI:
+    """Rotas da API e o cache de respostas por versão dos dados"""
+
+    def __init__(self, store, cache_size=512):
+        self.versions = DataVersions(store)
+        self.cache = LRUCache(maxsize=cache_size)
+        self.versions.on_switch(lambda nova, antiga: self.cache.discard(keep={nova}))
+        self.routes = {
+            '/versao': self.version,
+            '/metricas': self.metrics,
+            '/dimensoes': self.dimensions,
+            '/questoes': self.questions,
+        }
+
+    # Rotas: recebem a versão ativa, os filtros e a página, devolvem objetos JSON
+
+    def version(self, atual, filters, page):
+        return {
+            'versao': atual.versao,
+            'hospitais': list(atual.data.labels['hospital']),
+            'ciclos': list(atual.data.labels['ciclo']),
+        }
+
+    def _metrics(self, atual, filters):
+        cube = atual.cube.select(**filters)
+        if cube.counts.empty:
+            return None
+        return calculate_metrics(cube)
+
+    def metrics(self, atual, filters, page):
+        metrics = self._metrics(atual, filters)
+        if metrics is None:
+            return {'versao': atual.versao, 'total': 0, 'conformes': 0, 'nao_conformes': 0,
+                    'taxa_conformidade': None}
+        return {
+            'versao': atual.versao,
+            'total': metrics['total'],
+            'conformes': metrics['conformes'],
+            'nao_conformes': metrics['nao_conformes'],
+            'taxa_conformidade': round(metrics['taxa_conformidade'], 2),
+        }
+
+    def dimensions(self, atual, filters, page):
+        metrics = self._metrics(atual, filters)
+        rows = [] if metrics is None else [
+            {'dimensao': dim, 'total': int(row.total), 'conformes': int(row.conformes), 'taxa': float(row.taxa)}
+            for dim, row in metrics['dimensoes'].iterrows()
+        ]
+        return {'versao': atual.versao, 'dimensoes': rows}
+
+    def questions(self, atual, filters, page):
+        pagina, tamanho = page['pagina'], page['tamanho']
+
+        labels = atual.data.labels
+        hospitais = filters['hospital'] if filters['hospital'] is not None else labels['hospital']
+        ciclos = filters['ciclo'] if filters['ciclo'] is not None else labels['ciclo']
+        df, index = atual.selection(hospitais, ciclos)
+        selections = {
+            key: values for key, values in filters.items()
+            if key not in ('hospital', 'ciclo') and values is not None
+        }
+        mask = index.mask(**selections)
+
+        positions = mask.nonzero()[0]
+        start = (pagina - 1) * tamanho
+        page = df.iloc[positions[start:start + tamanho]].astype(object)
+        page = page.where(page.notna(), None).rename(columns=_plain)
+        return {
+            'versao': atual.versao,
+            'total': int(len(positions)),
+            'pagina': pagina,
+            'tamanho': tamanho,
+            'questoes': page.to_dict('records'),
+        }
+
+    def respond(self, path, query, if_none_match=None):
+        """Status, cabeçalhos extras e corpo de uma requisição GET"""
+        route = self.routes.get(path)
+        if route is None:
+            return HTTPStatus.NOT_FOUND, {}, _error(f"Rota desconhecida: {path}")
+        # Parâmetros inválidos dão 400 mesmo com um ETag conhecido
+        try:
+            filters, params = parse_filters(query)
+            page = parse_page(params)
+        except BadRequest as exc:
+            return HTTPStatus.BAD_REQUEST, {}, _error(str(exc))
+
+        self.versions.check()
+        atual = self.versions.active()
+        key = filter_key(path, atual.versao, **filters, **{k: [v] for k, v in page.items()})
+        headers = {'ETag': f'"{key[:20]}"', 'Cache-Control': 'no-cache'}
+        if if_none_match is not None and headers['ETag'] in [t.strip() for t in if_none_match.split(',')]:
+            return HTTPStatus.NOT_MODIFIED, headers, b''
+
+        body = self.cache.get_or_build(
+            key,
+            lambda: json.dumps(route(atual, filters, page), ensure_ascii=False).encode('utf-8'),
+            tag=atual.versao
+        )
+        return HTTPStatus.OK, headers, body
+
+    async def handle(self, reader, writer):
+        """Atende as requisições de uma conexão até ela fechar"""
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                headers = {}
+                for _ in range(MAX_HEADER_LINES):
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._send(writer, HTTPStatus.BAD_REQUEST, {}, _error("Requisição inválida"), False)
+                    break
+
+                keep_alive = (
+                    headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                ) or headers.get('connection', '').lower() == 'keep-alive'
+
+                if method not in ('GET', 'HEAD'):
+                    status, extra, body = HTTPStatus.METHOD_NOT_ALLOWED, {'Allow': 'GET, HEAD'}, _error("Só leitura")
+                else:
+                    url = urlsplit(target)
+                    try:
+                        status, extra, body = await asyncio.to_thread(
+                            self.respond, url.path.rstrip('/') or '/', url.query, headers.get('if-none-match')
+                        )
+                    except Exception:
+                        traceback.print_exc()
+                        status, extra, body = HTTPStatus.INTERNAL_SERVER_ERROR, {}, _error("Erro interno")
+                await self._send(writer, status, extra, body, keep_alive, head=method == 'HEAD')
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _send(self, writer, status, extra, body, keep_alive, head=False):
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+        headers = {
+            'Content-Type': 'application/json; charset=utf-8',
+            'Content-Length': str(len(body)),
+            'Connection': 'keep-alive' if keep_alive else 'close',
+            **extra,
+        }
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if not head:
+            writer.write(body)
+        await writer.drain()
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        # Carrega a versão ativa antes de aceitar conexões
+        await asyncio.to_thread(self.versions.active)
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def _error(message):
+    return json.dumps({'erro': message}, ensure_ascii=False).encode('utf-8')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API HTTP/JSON somente leitura do painel IG-SEST")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--armazem', default=DEFAULT_ROOT, help="raiz do armazém (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+
+    api = ComplianceAPI(open_store(args.armazem))
+    print(f"API em http://{args.host}:{args.porta}/", file=sys.stderr)
+    try:
+        asyncio.run(api.serve(args.host, args.porta))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""Gravação atômica de arquivos: leitores veem o arquivo antigo ou o novo, nunca um pela metade"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+def staging_path(path, suffix='.tmp'):
+    """Arquivo temporário vazio ao lado de ``path``, para ``os.replace`` depois"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix=suffix)
+    os.close(fd)
+    return tmp_path
+
+
+@contextmanager
+def replacing(path, suffix='.tmp'):
+    """Caminho temporário ao lado de ``path``, trocado por ele ao sair do bloco
+
+    Se o bloco falhar, o temporário é removido e ``path`` fica como estava.
+    """
+    tmp_path = staging_path(path, suffix)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,119 @@
+"""Gráficos Plotly do painel, montados a partir do cubo de contagens
+
+O Plotly só é importado quando um gráfico é de fato montado.
+"""
+
+STATUS_COLORS = {'Conforme': '#28a745', 'Não Conforme': '#dc3545'}
+PRIORITY_COLORS = {'Alta': '#dc3545', 'Média': '#fd7e14', 'Baixa': '#ffc107'}
+
+
+def create_overview_charts(cube):
+    """Cria gráficos de visão geral a partir do cubo de contagens"""
+    import plotly.graph_objects as go
+
+    # Gráfico de pizza - Status geral
+    status_counts = cube.totals('status').sort_values(ascending=False)
+
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=status_counts.index,
+        values=status_counts.values,
+        hole=0.4,
+        marker_colors=[STATUS_COLORS[s] for s in status_counts.index],
+        textinfo='label+percent+value',
+        textfont_size=14
+    )])
+
+    fig_pie.update_layout(
+        title="Distribuição Geral de Conformidades",
+        title_x=0.5,
+        font=dict(size=14),
+        showlegend=True,
+        height=400
+    )
+
+    # Gráfico de barras por dimensão
+    dimension_summary = cube.totals(['dimensão', 'status']).unstack(fill_value=0)
+    dimension_summary = dimension_summary.reindex(columns=list(STATUS_COLORS), fill_value=0)
+
+    fig_bar = go.Figure()
+    for status, color in STATUS_COLORS.items():
+        fig_bar.add_trace(go.Bar(
+            name=status,
+            x=dimension_summary.index,
+            y=dimension_summary[status],
+            marker_color=color
+        ))
+
+    fig_bar.update_layout(
+        title="Conformidades por Dimensão",
+        xaxis_title="Dimensões",
+        yaxis_title="Número de Questões",
+        barmode='stack',
+        height=400,
+        xaxis_tickangle=-45
+    )
+
+    return fig_pie, fig_bar
+
+
+def create_priority_chart(cube):
+    """Cria gráfico de prioridades das não conformidades"""
+    import plotly.graph_objects as go
+
+    non_conformes = cube.select(status=['Não Conforme'])
+    priority_counts = non_conformes.totals('prioridade').sort_values(ascending=False)
+
+    fig = go.Figure(data=[go.Bar(
+        x=priority_counts.index,
+        y=priority_counts.values,
+        marker_color=[PRIORITY_COLORS[p] for p in priority_counts.index],
+        text=priority_counts.values,
+        textposition='auto'
+    )])
+
+    fig.update_layout(
+        title="Não Conformidades por Prioridade",
+        xaxis_title="Prioridade",
+        yaxis_title="Número de Questões",
+        height=400
+    )
+
+    return fig
+
+
+def create_trend_chart(trend, title, reference=None):
+    """Linhas da taxa de conformidade por ciclo, uma por série
+
+    ``trend`` vem de ``trends.trend_table``; a variação e a média móvel
+    aparecem ao passar o mouse. ``reference`` desenha uma linha de meta.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for serie, rows in trend.groupby('serie', sort=False):
+        fig.add_trace(go.Scatter(
+            name=serie,
+            x=rows['ciclo'],
+            y=rows['taxa'],
+            mode='lines+markers',
+            customdata=rows[['variacao', 'media_movel']].to_numpy(),
+            hovertemplate=(
+                "%{x}: %{y:.1f}%<br>"
+                "Variação: %{customdata[0]:+.1f} p.p.<br>"
+                "Média móvel: %{customdata[1]:.1f}%"
+                "<extra>%{fullData.name}</extra>"
+            )
+        ))
+
+    if reference is not None:
+        fig.add_hline(y=reference, line_dash='dash', line_color='gray')
+
+    fig.update_layout(
+        title=title,
+        xaxis_title="Ciclo",
+        yaxis_title="Taxa de Conformidade (%)",
+        xaxis_type='category',
+        height=400
+    )
+
+    return fig
@@ -0,0 +1,144 @@
+"""Checklist em forma compacta: códigos inteiros e tabelas de rótulos"""
+
+import numpy as np
+import pandas as pd
+
+from igsest.schema import FIXED_LABELS
+
+
+def code_dtype(size):
+    """Menor inteiro com sinal que comporta ``size`` códigos mais o -1 de vazio"""
+    for candidate in (np.int8, np.int16, np.int32):
+        if size <= np.iinfo(candidate).max:
+            return np.dtype(candidate)
+    return np.dtype(np.int64)
+
+
+def _encode_arrow(array, fixed=None):
+    """Códigos e rótulos de uma coluna Arrow de texto"""
+    import pyarrow.compute as pc
+
+    encoded = array.combine_chunks().dictionary_encode()
+    indices = pc.fill_null(encoded.indices, -1).to_numpy()
+    dictionary = encoded.dictionary.to_pylist()
+
+    # Rótulos em ordem fixa ou alfabética, como nas categorias do pandas
+    labels = list(fixed) if fixed is not None else sorted(dictionary)
+    position = {label: i for i, label in enumerate(labels)}
+    # O último elemento atende o índice -1 (valor vazio)
+    remap = np.array([position.get(v, -1) for v in dictionary] + [-1])
+    return remap[indices].astype(code_dtype(len(labels))), labels
+
+
+class CompactChecklist:
+    """Linhas do checklist guardadas como arrays de códigos inteiros
+
+    Cada coluna é um array NumPy de códigos (o menor inteiro que comporta o
+    vocabulário, -1 para vazio) mais a lista de rótulos, guardada uma vez.
+    A descrição não tem coluna própria: é guardada uma vez por questão e
+    recuperada pelo código da questão.
+    """
+
+    def __init__(self, codes, labels, descriptions=None, columns=None):
+        self.codes = codes
+        self.labels = labels
+        # Código da descrição de cada questão, e os textos sem repetição
+        self.descriptions = descriptions
+        self.columns = list(columns or codes)
+
+    def __len__(self):
+        return len(next(iter(self.codes.values()), ()))
+
+    @classmethod
+    def from_arrow(cls, table, partitions=(), lengths=(), partition_keys=()):
+        """Codifica uma tabela Arrow de texto, somando as chaves de partição
+
+        ``partitions`` traz os valores das chaves de cada bloco de linhas e
+        ``lengths`` o número de linhas de cada bloco, na ordem da tabela.
+        """
+        codes, labels = {}, {}
+        for position, key in enumerate(partition_keys):
+            values = [part[position] for part in partitions]
+            labels[key] = sorted(set(values))
+            lookup = {v: i for i, v in enumerate(labels[key])}
+            codes[key] = np.repeat(
+                np.array([lookup[v] for v in values], dtype=code_dtype(len(labels[key]))),
+                list(lengths)
+            )
+
+        descriptions = None
+        for column in table.column_names:
+            if column == 'descrição':
+                continue
+            codes[column], labels[column] = _encode_arrow(table.column(column), FIXED_LABELS.get(column))
+
+        columns = list(partition_keys) + table.column_names
+        if 'descrição' in table.column_names:
+            row_codes, texts = _encode_arrow(table.column('descrição'))
+            descriptions = cls._intern(codes['questão'], len(labels['questão']), row_codes, texts)
+        return cls(codes, labels, descriptions, columns)
+
+    @staticmethod
+    def _intern(question_codes, n_questions, row_codes, texts):
+        """Primeira descrição vista para cada questão"""
+        per_question = np.full(n_questions, -1, dtype=row_codes.dtype)
+        valid = question_codes >= 0
+        questions, first = np.unique(question_codes[valid], return_index=True)
+        per_question[questions] = row_codes[valid][first]
+        return per_question, texts
+
+    def column_codes(self, column):
+        """Códigos por linha de uma coluna, inclusive a descrição derivada"""
+        if column == 'descrição':
+            per_question, _ = self.descriptions
+            return np.append(per_question, -1)[self.codes['questão']]
+        return self.codes[column]
+
+    def column_labels(self, column):
+        if column == 'descrição':
+            return self.descriptions[1]
+        return self.labels[column]
+
+    def select(self, **values):
+        """Linhas com os valores escolhidos de cada coluna
+
+        Quando as linhas escolhidas são contíguas (ex.: um hospital inteiro),
+        os arrays resultantes são vistas dos originais, sem cópia.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, chosen in values.items():
+            if chosen is None:
+                continue
+            lookup = {label: code for code, label in enumerate(self.labels[column])}
+            wanted = [lookup[v] for v in chosen if v in lookup]
+            mask &= np.isin(self.codes[column], wanted)
+        positions = np.flatnonzero(mask)
+        if len(positions) == 0 or positions[-1] - positions[0] + 1 == len(positions):
+            start = positions[0] if len(positions) else 0
+            return self.take(slice(start, start + len(positions)))
+        return self.take(positions)
+
+    def take(self, positions):
+        """Subconjunto das linhas, compartilhando as tabelas de rótulos"""
+        codes = {column: values[positions] for column, values in self.codes.items()}
+        return CompactChecklist(codes, self.labels, self.descriptions, self.columns)
+
+    def frame(self, columns=None):
+        """DataFrame de colunas categóricas montado sobre os códigos, sem copiá-los"""
+        columns = list(columns or self.columns)
+        categories = {
+            column: pd.CategoricalDtype(self.column_labels(column)) for column in columns
+        }
+        return pd.DataFrame({
+            column: pd.Categorical.from_codes(
+                self.column_codes(column), dtype=categories[column], validate=False
+            )
+            for column in columns
+        }, copy=False)
+
+    def nbytes(self):
+        """Memória aproximada dos códigos (as tabelas de rótulos são pequenas)"""
+        total = sum(values.nbytes for values in self.codes.values())
+        if self.descriptions is not None:
+            total += self.descriptions[0].nbytes
+        return total
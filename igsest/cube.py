@@ -0,0 +1,151 @@
+"""Cubo de contagens pré-agregadas das conformidades"""
+
+import numpy as np
+import pandas as pd
+
+from igsest.atomic import replacing
+from igsest.compact import code_dtype
+
+CUBE_KEYS = ['hospital', 'ciclo', 'dimensão', 'fonte', 'prioridade', 'status']
+PARTITION_KEYS = ['hospital', 'ciclo']
+
+# Chave dos metadados do Parquet com a versão do armazém contada no cubo
+VERSION_KEY = b'igsest_versao'
+
+
+def count_rows(df):
+    """Conta as linhas do checklist por combinação das chaves do cubo"""
+    if df.empty:
+        return pd.DataFrame({**{k: pd.Series(dtype='object') for k in CUBE_KEYS}, 'n': pd.Series(dtype='int64')})
+    counts = df.groupby(CUBE_KEYS, observed=True).size().rename('n').reset_index()
+    return counts.astype({k: 'object' for k in CUBE_KEYS})
+
+
+def count_codes(codes, labels):
+    """Contagens por combinação das chaves do cubo, direto dos códigos compactos
+
+    Devolve os códigos de cada chave por grupo e a contagem ``n`` de cada
+    grupo. Linhas com alguma chave vazia ficam de fora, como no ``groupby``
+    de ``count_rows``.
+    """
+    keys = [np.asarray(codes[k]) for k in CUBE_KEYS]
+    sizes = [len(labels[k]) for k in CUBE_KEYS]
+    valid = np.logical_and.reduce([k >= 0 for k in keys])
+    if not valid.any():
+        return {k: np.zeros(0, dtype=code_dtype(s)) for k, s in zip(CUBE_KEYS, sizes)}, np.zeros(0, dtype=np.int64)
+
+    groups, n = np.unique(np.ravel_multi_index([k[valid] for k in keys], sizes), return_counts=True)
+    group_codes = np.unravel_index(groups, sizes)
+    return (
+        {k: c.astype(code_dtype(s)) for k, c, s in zip(CUBE_KEYS, group_codes, sizes)},
+        n.astype(np.int64)
+    )
+
+
+class MetricsCube:
+    """Contagens por (hospital, ciclo, dimensão, fonte, prioridade, status)
+
+    Cada linha de ``counts`` é um grupo; as consultas percorrem os grupos,
+    nunca as linhas originais do checklist.
+    """
+
+    def __init__(self, counts=None, versao=None):
+        self.counts = count_rows(pd.DataFrame(columns=CUBE_KEYS)) if counts is None else counts
+        # Versão do armazém a que as contagens correspondem, se conhecida
+        self.versao = versao
+
+    @classmethod
+    def from_rows(cls, df):
+        return cls(count_rows(df))
+
+    @classmethod
+    def from_codes(cls, codes, labels, n):
+        """Cubo de colunas categóricas sobre códigos por grupo, sem copiá-los
+
+        Com códigos mapeados do disco, as contagens ficam na memória
+        compartilhada entre processos.
+        """
+        columns = {
+            k: pd.Categorical.from_codes(codes[k], dtype=pd.CategoricalDtype(labels[k]), validate=False)
+            for k in CUBE_KEYS
+        }
+        return cls(pd.DataFrame({**columns, 'n': n}, copy=False))
+
+    def _merge(self, delta):
+        merged = pd.concat([self.counts, delta], ignore_index=True)
+        merged = merged.groupby(CUBE_KEYS, sort=False, observed=True)['n'].sum().reset_index()
+        self.counts = merged[merged['n'] > 0].reset_index(drop=True)
+
+    def add(self, df):
+        """Soma ao cubo as linhas novas do checklist"""
+        self._merge(count_rows(df))
+
+    def remove(self, df):
+        """Desconta do cubo linhas que deixaram de existir"""
+        delta = count_rows(df)
+        delta['n'] = -delta['n']
+        self._merge(delta)
+
+    def update(self, old_rows, new_rows):
+        """Aplica a alteração de linhas já contadas"""
+        self.remove(old_rows)
+        self.add(new_rows)
+
+    def replace_partition(self, hospital, ciclo, df):
+        """Troca as contagens de um (hospital, ciclo) pelas de ``df``"""
+        self.replace_counts(hospital, ciclo, count_rows(df.assign(hospital=hospital, ciclo=ciclo)))
+
+    def replace_counts(self, hospital, ciclo, counts):
+        """Troca as contagens de um (hospital, ciclo) por contagens já prontas"""
+        self.replace_many_counts({(hospital, ciclo): counts})
+
+    def replace_many_counts(self, counts):
+        """Troca as contagens de vários ``{(hospital, ciclo): contagens}``
+
+        O cubo é reagregado uma vez só, não uma vez por partição.
+        """
+        if not counts:
+            return
+        replaced = pd.MultiIndex.from_tuples(list(counts), names=PARTITION_KEYS)
+        keep = ~pd.MultiIndex.from_frame(self.counts[PARTITION_KEYS].astype(object)).isin(replaced)
+        self.counts = self.counts[keep].reset_index(drop=True)
+        self._merge(pd.concat(list(counts.values()), ignore_index=True))
+
+    def select(self, **filters):
+        """Restringe o cubo aos valores escolhidos de cada chave
+
+        Chaves sem filtro (ou com ``None``) ficam inteiras.
+        """
+        mask = pd.Series(True, index=self.counts.index)
+        for key, values in filters.items():
+            if key not in CUBE_KEYS:
+                raise KeyError(key)
+            if values is not None:
+                mask &= self.counts[key].isin(list(values))
+        return MetricsCube(self.counts[mask].reset_index(drop=True))
+
+    def totals(self, by):
+        """Soma as contagens agrupando pelas chaves ``by``"""
+        return self.counts.groupby(by, sort=True, observed=True)['n'].sum()
+
+    def save(self, path, versao=None):
+        """Grava as contagens, marcadas com a versão do armazém que contam"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(self.counts, preserve_index=False)
+        if versao is not None:
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), VERSION_KEY: str(versao).encode()})
+        with replacing(path) as tmp_path:
+            pq.write_table(table, tmp_path)
+
+    @classmethod
+    def load(cls, path):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        versao = (table.schema.metadata or {}).get(VERSION_KEY)
+        return cls(
+            table.to_pandas().astype({k: 'object' for k in CUBE_KEYS}),
+            versao.decode() if versao is not None else None
+        )
@@ -0,0 +1,84 @@
+"""Fontes de dados colunares para o checklist IG-SEST"""
+
+import os
+
+import pandas as pd
+
+from igsest.schema import COLUMNS, normalize, with_dtypes
+
+BUNDLED_CHECKLIST = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'dados', 'checklist_mejc_ufrn.csv'
+)
+
+
+def _read_csv(path, columns):
+    header = pd.read_csv(path, nrows=0).columns
+    rename = {c: normalize(c) for c in header}
+    usecols = [c for c in header if rename[c] in columns]
+    df = pd.read_csv(path, usecols=usecols, dtype=str)
+    return df.rename(columns=rename)
+
+
+def _read_parquet(path, columns):
+    import pyarrow.parquet as pq
+
+    names = pq.read_schema(path).names
+    selected = [c for c in names if normalize(c) in columns]
+    df = pd.read_parquet(path, columns=selected)
+    return df.rename(columns=normalize)
+
+
+def _read_excel(path, columns):
+    from openpyxl import load_workbook
+
+    # Modo read_only percorre as linhas sem montar a planilha inteira
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = [normalize(c) for c in next(rows, ())]
+        positions = {c: i for i, c in enumerate(header) if c in columns}
+        data = {c: [] for c in positions}
+        for row in rows:
+            if not any(row):
+                continue
+            for c, i in positions.items():
+                data[c].append(row[i] if i < len(row) else None)
+    finally:
+        wb.close()
+    return pd.DataFrame(data)
+
+
+READERS = {
+    '.csv': _read_csv,
+    '.parquet': _read_parquet,
+    '.xlsx': _read_excel,
+}
+
+
+def register_reader(extension, reader):
+    """Registra um leitor para uma nova extensão de arquivo"""
+    READERS[extension.lower()] = reader
+
+
+def read_rows(path, columns=None):
+    """Lê as linhas como texto, sem espaços nas pontas e sem aplicar os tipos"""
+
+    columns = list(columns or COLUMNS)
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"Formato não suportado: {extension}")
+
+    df = READERS[extension](path, columns)
+
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise ValueError(f"Colunas ausentes em {path}: {', '.join(missing)}")
+
+    df = df[columns].astype('string')
+    return df.apply(lambda values: values.str.strip())
+
+
+def read_checklist(path=BUNDLED_CHECKLIST, columns=None):
+    """Lê linhas do checklist de um arquivo Parquet, CSV ou Excel"""
+    return with_dtypes(read_rows(path, columns))
@@ -0,0 +1,191 @@
+"""Exportação do checklist para download, gravada em partes"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+from igsest.atomic import replacing
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Linhas convertidas por vez ao escrever a planilha principal
+CHUNK_SIZE = 10000
+
+
+def _iter_rows(df, chunk_size):
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size].astype(object)
+        chunk = chunk.where(chunk.notna(), None)
+        yield from chunk.itertuples(index=False, name=None)
+
+
+def write_excel(df, cube, target, chunk_size=CHUNK_SIZE):
+    """Escreve o relatório em ``target`` (caminho ou arquivo binário)
+
+    A planilha principal é escrita em modo write-only, sem manter as células
+    em memória; os resumos vêm do cubo de contagens.
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+
+    # Planilha principal
+    ws = wb.create_sheet('Conformidades')
+    ws.append([str(c) for c in df.columns])
+    for row in _iter_rows(df, chunk_size):
+        ws.append(row)
+
+    # Resumo por dimensão
+    summary = cube.totals(['dimensão', 'status']).unstack(fill_value=0)
+    summary = summary.reindex(columns=['Conforme', 'Não Conforme'], fill_value=0)
+    summary['Total'] = summary.sum(axis=1)
+    summary['Taxa_Conformidade'] = (summary['Conforme'] / summary['Total'] * 100).round(2)
+    ws = wb.create_sheet('Resumo_Dimensoes')
+    ws.append(['dimensão'] + list(summary.columns))
+    for row in summary.itertuples(name=None):
+        ws.append(row)
+
+    # Não conformidades por prioridade
+    priority_summary = cube.select(status=['Não Conforme']).totals('prioridade')
+    ws = wb.create_sheet('Nao_Conformidades')
+    ws.append(['prioridade', 'Quantidade'])
+    for prioridade, quantidade in priority_summary.items():
+        ws.append([prioridade, int(quantidade)])
+
+    wb.save(target)
+
+
+# Formatos oferecidos para download: (MIME, extensão)
+DOWNLOAD_FORMATS = {
+    'csv': ('text/csv', '.csv'),
+    'csv.gz': ('application/gzip', '.csv.gz'),
+    'parquet': ('application/vnd.apache.parquet', '.parquet'),
+    'xlsx': (XLSX_MIME, '.xlsx'),
+}
+
+
+def write_csv(df, target, compress=False, chunk_size=CHUNK_SIZE):
+    """Escreve o CSV em partes, opcionalmente compactado com gzip"""
+    import gzip
+
+    with open(target, 'wb') as raw:
+        output = gzip.GzipFile(fileobj=raw, mode='wb') if compress else raw
+        try:
+            for start in range(0, max(len(df), 1), chunk_size):
+                chunk = df.iloc[start:start + chunk_size]
+                output.write(chunk.to_csv(index=False, header=start == 0).encode('utf-8'))
+        finally:
+            if compress:
+                output.close()
+
+
+def write_parquet(df, target, chunk_size=CHUNK_SIZE):
+    """Escreve o Parquet um grupo de linhas por vez"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    with pq.ParquetWriter(target, schema) as writer:
+        for start in range(0, len(df), chunk_size):
+            chunk = df.iloc[start:start + chunk_size]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def write_download(df, fmt, target, cube=None, chunk_size=CHUNK_SIZE):
+    """Escreve ``df`` no formato pedido"""
+    if fmt == 'csv':
+        write_csv(df, target, chunk_size=chunk_size)
+    elif fmt == 'csv.gz':
+        write_csv(df, target, compress=True, chunk_size=chunk_size)
+    elif fmt == 'parquet':
+        write_parquet(df, target, chunk_size)
+    elif fmt == 'xlsx':
+        write_excel(df, cube, target, chunk_size)
+    else:
+        raise ValueError(f"Formato de download desconhecido: {fmt}")
+
+
+class DownloadCache:
+    """Arquivos de download gerados sob demanda e guardados em disco
+
+    Cada arquivo é identificado pela chave (versão dos dados e seleção) e
+    pelo formato; só os ``max_files`` mais recentes são mantidos. Cada
+    arquivo é gerado sob a trava da sua chave, então downloads diferentes
+    são gerados em paralelo e o mesmo só uma vez.
+    """
+
+    def __init__(self, directory, max_files=32):
+        self.directory = directory
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._path_locks = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key, fmt):
+        return os.path.join(self.directory, f"{key}{DOWNLOAD_FORMATS[fmt][1]}")
+
+    @contextmanager
+    def _locked(self, path):
+        """Trava do arquivo ``path``; a limpeza descarta travas de arquivos removidos"""
+        while True:
+            with self._lock:
+                path_lock = self._path_locks.setdefault(path, threading.Lock())
+            path_lock.acquire()
+            with self._lock:
+                if self._path_locks.get(path) is path_lock:
+                    break
+            path_lock.release()
+        try:
+            yield
+        finally:
+            path_lock.release()
+
+    def _ready(self, path, fmt, df, cube):
+        """Gera o arquivo se ainda não existir; chamado com a trava de ``path``"""
+        if os.path.exists(path):
+            os.utime(path)
+            with self._lock:
+                self.hits += 1
+            return
+        with replacing(path) as tmp_path:
+            write_download(df, fmt, tmp_path, cube)
+        with self._lock:
+            self.misses += 1
+            self._prune()
+
+    def get(self, key, fmt, df, cube=None):
+        """Caminho do arquivo pronto, gerando-o se ainda não existir"""
+        path = self.path(key, fmt)
+        with self._locked(path):
+            self._ready(path, fmt, df, cube)
+        return path
+
+    def read(self, key, fmt, df, cube=None):
+        """Bytes do arquivo pronto, aceitos pelo ``st.download_button``"""
+        path = self.path(key, fmt)
+        with self._locked(path):
+            self._ready(path, fmt, df, cube)
+            with open(path, 'rb') as f:
+                return f.read()
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def _prune(self):
+        files = [
+            entry for entry in os.scandir(self.directory)
+            if entry.is_file() and not entry.name.endswith('.tmp')
+        ]
+        files.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in files[self.max_files:]:
+            # Arquivo em geração ou leitura fica para a próxima limpeza
+            path_lock = self._path_locks.get(entry.path)
+            if path_lock is not None and not path_lock.acquire(blocking=False):
+                continue
+            os.remove(entry.path)
+            self._path_locks.pop(entry.path, None)
+            if path_lock is not None:
+                path_lock.release()
@@ -0,0 +1,24 @@
+"""Cache LRU de figuras Plotly compartilhado entre sessões"""
+
+import hashlib
+import json
+
+from igsest.lru import LRUCache
+
+
+def filter_key(name, versao, **filters):
+    """Chave estável para um gráfico, o estado dos filtros e a versão dos dados"""
+    state = {
+        column: None if values is None else sorted(str(v) for v in values)
+        for column, values in filters.items()
+    }
+    payload = json.dumps([name, versao, state], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class FigureCache(LRUCache):
+    """Guarda as figuras montadas, descartando as menos usadas
+
+    As figuras são compartilhadas entre sessões e não devem ser alteradas
+    depois de devolvidas.
+    """
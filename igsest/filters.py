@@ -0,0 +1,59 @@
+"""Índice de bitmaps para os filtros da barra lateral"""
+
+import numpy as np
+import pandas as pd
+
+FILTER_COLUMNS = ['dimensão', 'status', 'prioridade', 'fonte']
+
+
+class FilterIndex:
+    """Um bitmap por valor de cada coluna filtrável
+
+    Os bitmaps são montados uma vez por conjunto de dados; cada filtro vira
+    OR entre os valores escolhidos de uma coluna e AND entre colunas, feitos
+    byte a byte sobre arrays compactados com ``np.packbits``.
+    """
+
+    def __init__(self, df, columns=FILTER_COLUMNS):
+        self.size = len(df)
+        self._bitmaps = {}
+        self._options = {}
+        for column in columns:
+            values = df[column].astype('category')
+            codes = values.cat.codes.to_numpy()
+            categories = values.cat.categories
+            # Valores distintos na ordem em que aparecem, como Series.unique()
+            present = pd.unique(codes[codes >= 0])
+            self._options[column] = [categories[code] for code in present]
+            self._bitmaps[column] = {
+                categories[code]: np.packbits(codes == code) for code in present
+            }
+
+    def options(self, column):
+        """Valores distintos da coluna, calculados na montagem do índice"""
+        return list(self._options[column])
+
+    def mask(self, **selections):
+        """Máscara booleana das linhas que atendem a todos os filtros"""
+        result = None
+        for column, values in selections.items():
+            bitmaps = self._bitmaps[column]
+            values = set(values)
+            if values.issuperset(bitmaps):
+                continue
+            column_bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+            for value in values & bitmaps.keys():
+                column_bits |= bitmaps[value]
+            result = column_bits if result is None else result & column_bits
+
+        if result is None:
+            return np.ones(self.size, dtype=bool)
+        return np.unpackbits(result, count=self.size).astype(bool)
+
+    def filter(self, df, **selections):
+        """Linhas de ``df`` (o mesmo usado na montagem) que passam nos filtros
+
+        Sem filtro que exclua linhas devolve o próprio ``df``, sem cópia.
+        """
+        mask = self.mask(**selections)
+        return df if mask.all() else df[mask]
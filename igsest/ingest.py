@@ -0,0 +1,162 @@
+"""Carga em lote de questionários dos hospitais no armazém
+
+Cada arquivo traz o checklist de um hospital num ciclo, indicados pelo nome
+``<hospital>_<ciclo>.xlsx`` (ou ``<hospital>.xlsx`` com ``--ciclo``). Os
+arquivos são lidos linha a linha, validados e gravados em paralelo num pool
+de processos, em temporários ainda invisíveis. No final as partições novas
+entram no armazém e o cubo de contagens é atualizado uma vez:
+
+    python -m igsest.ingest questionarios/ --ciclo 2025
+    python -m igsest.ingest questionarios/*.xlsx --verificar
+
+As partições entram uma a uma, mas sob a marca de carga do armazém: quem
+publica uma versão nova (``open_shared``, ``DataVersions.check``) espera a
+marca sair, então o painel nunca mostra o lote pela metade. Quem lê as
+partições direto, com ``ComplianceStore.read``, pode ver um ciclo parcial.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from igsest.cube import count_rows
+from igsest.datasource import BUNDLED_CHECKLIST, READERS, read_rows
+from igsest.schema import validate, with_dtypes
+from igsest.store import DEFAULT_ROOT, ComplianceStore, _check_key
+
+
+def partition_of(path, ciclo=None):
+    """(hospital, ciclo) indicados pelo nome do arquivo"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if ciclo is None:
+        hospital, sep, ciclo = stem.rpartition('_')
+        if not sep:
+            raise ValueError("nome sem ciclo; use <hospital>_<ciclo> ou --ciclo")
+    else:
+        hospital = stem
+    return _check_key('hospital', hospital), _check_key('ciclo', ciclo)
+
+
+def find_files(paths):
+    """Arquivos de formato conhecido, expandindo diretórios"""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for name in sorted(os.listdir(path)):
+            # Ignora arquivos ocultos e de bloqueio do Excel (~$...)
+            if name.startswith(('.', '~$')):
+                continue
+            if os.path.splitext(name)[1].lower() in READERS:
+                yield os.path.join(path, name)
+
+
+def ingest_file(root, path, hospital, ciclo, questions=None, check_only=False):
+    """Lê, valida e prepara um arquivo; executado num processo do pool
+
+    Devolve as contagens do cubo e o temporário da partição preparada
+    (``None`` se nada foi gravado) e a lista de problemas encontrados.
+    """
+    try:
+        rows = read_rows(path)
+    except Exception as exc:
+        return None, None, [f"{type(exc).__name__}: {exc}"]
+
+    errors = validate(rows, questions)
+    if errors or check_only:
+        return None, None, errors
+
+    df = with_dtypes(rows)
+    staged = ComplianceStore(root)._stage_partition(df, hospital, ciclo)
+    return count_rows(df.assign(hospital=hospital, ciclo=ciclo)), staged, []
+
+
+def checklist_questions():
+    """Identificadores de questão do checklist embarcado"""
+    return sorted(set(read_rows(BUNDLED_CHECKLIST, ['questão'])['questão'].dropna()))
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"deve ser pelo menos 1: {value}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Carrega questionários de hospitais no armazém")
+    parser.add_argument('paths', nargs='+', help="arquivos .xlsx, .csv ou .parquet, ou diretórios com eles")
+    parser.add_argument('--ciclo', help="ciclo de todos os arquivos; o nome do arquivo é o hospital")
+    parser.add_argument('--armazem', default=DEFAULT_ROOT, help="raiz do armazém (padrão: %(default)s)")
+    parser.add_argument('--workers', type=positive_int, default=os.cpu_count() or 1, help="processos em paralelo")
+    parser.add_argument('--verificar', action='store_true', help="só valida, sem gravar")
+    parser.add_argument('--questoes-livres', action='store_true',
+                        help="aceita questões que não estão no checklist embarcado")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    tasks = {}
+    for path in find_files(args.paths):
+        try:
+            key = partition_of(path, args.ciclo)
+        except ValueError as exc:
+            print(f"{path}: {exc}", file=sys.stderr)
+            failures += 1
+            continue
+        if key in tasks:
+            print(f"{path}: {key[0]}/{key[1]} já vem de {tasks[key]}", file=sys.stderr)
+            failures += 1
+            continue
+        tasks[key] = path
+
+    questions = None if args.questoes_livres else checklist_questions()
+    store = ComplianceStore(args.armazem)
+    written = {}
+    valid = 0
+    try:
+        if tasks:
+            # spawn, como na fila de exportações: não herda o estado do processo pai
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(min(args.workers, len(tasks)), mp_context=context) as pool:
+                futures = {
+                    pool.submit(ingest_file, store.root, path, hospital, ciclo, questions, args.verificar):
+                        (path, hospital, ciclo)
+                    for (hospital, ciclo), path in tasks.items()
+                }
+                for future in as_completed(futures):
+                    path, hospital, ciclo = futures[future]
+                    counts, staged, errors = future.result()
+                    if errors:
+                        failures += 1
+                        print(f"{path}: {len(errors)} problema(s)", file=sys.stderr)
+                        for error in errors:
+                            print(f"  {error}", file=sys.stderr)
+                        continue
+                    valid += 1
+                    if counts is not None:
+                        written[(hospital, ciclo)] = (counts, staged)
+
+        if written:
+            # Contagens novas sobre o cubo da versão anterior, gravado depois
+            # das partições com a marca da versão nova
+            cube = store.cube()
+            cube.replace_many_counts({key: counts for key, (counts, _) in written.items()})
+            with store.loading():
+                for (hospital, ciclo), (_, staged) in list(written.items()):
+                    store._commit_partition(staged, hospital, ciclo)
+                    del written[(hospital, ciclo)]
+                store._save_cube(cube)
+    finally:
+        # Temporários de uma carga interrompida não entram no armazém
+        for _, staged in written.values():
+            if os.path.exists(staged):
+                os.remove(staged)
+
+    print(f"{valid} arquivo(s) {'válido(s)' if args.verificar else 'gravado(s)'}, {failures} com problema")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
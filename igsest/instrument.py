@@ -0,0 +1,75 @@
+"""Medição das etapas de cada execução do painel"""
+
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class RerunProfile:
+    """Tempos das etapas de uma execução, com cProfile opcional"""
+
+    def __init__(self, profile=False):
+        self.started = datetime.now()
+        self.spans = {}
+        self.profile_text = None
+        self._start = time.perf_counter()
+        self._profiler = None
+        if profile:
+            self._profiler = cProfile.Profile()
+            try:
+                self._profiler.enable()
+            except ValueError:
+                # Outro profiler já está ativo neste processo
+                self._profiler = None
+
+    @contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] = self.spans.get(name, 0.0) + time.perf_counter() - start
+
+    def finish(self, top=30):
+        """Encerra a medição; devolve o resumo da execução"""
+        total = time.perf_counter() - self._start
+        if self._profiler is not None:
+            self._profiler.disable()
+            output = io.StringIO()
+            pstats.Stats(self._profiler, stream=output).sort_stats('cumulative').print_stats(top)
+            self.profile_text = output.getvalue()
+            self._profiler = None
+        return {
+            'started': self.started.isoformat(timespec='seconds'),
+            'total': total,
+            'spans': dict(self.spans),
+            'profile': self.profile_text,
+        }
+
+
+class RerunLog:
+    """Últimas execuções medidas, para achar as mais lentas"""
+
+    def __init__(self, maxlen=200):
+        self._items = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def append(self, summary):
+        with self._lock:
+            self._items.append(summary)
+
+    def items(self):
+        with self._lock:
+            return list(self._items)
+
+    def slowest(self, n=10):
+        return sorted(self.items(), key=lambda s: s['total'], reverse=True)[:n]
+
+    def to_json(self, **extra):
+        return json.dumps({'reruns': self.items(), **extra}, ensure_ascii=False, indent=2)
@@ -0,0 +1,138 @@
+"""Fila de exportações executadas em segundo plano num pool de processos"""
+
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from igsest.atomic import replacing
+from igsest.export import DOWNLOAD_FORMATS, write_download
+from igsest.shared import open_shared
+from igsest.store import ComplianceStore
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+def _export_worker(root, versao, hospitais, ciclos, fmt, path):
+    """Executado no processo filho: mapeia os dados publicados e grava o arquivo final"""
+    aberta, data, cube = open_shared(ComplianceStore(root), versao)
+    if aberta != versao:
+        # O relatório foi pedido sobre dados que já saíram de publicação
+        raise ValueError(f"A versão {versao} dos dados não está mais disponível; gere o relatório de novo")
+    df = data.select(hospital=hospitais, ciclo=ciclos).frame()
+    cube = cube.select(hospital=hospitais, ciclo=ciclos)
+
+    with replacing(path) as tmp_path:
+        write_download(df, fmt, tmp_path, cube)
+    return path
+
+
+class ExportJobs:
+    """Tabela de jobs de exportação e seus arquivos em disco
+
+    Pedidos iguais (mesma versão dos dados, seleção e formato) reaproveitam
+    o job existente. Arquivos concluídos expiram após ``ttl`` segundos.
+    """
+
+    def __init__(self, directory, max_workers=2, ttl=3600):
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+        # spawn evita herdar as threads do servidor Streamlit via fork
+        self._pool = ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context('spawn'))
+        self._jobs = {}
+        self._by_key = {}
+        self._lock = threading.RLock()
+
+    def submit(self, store, versao, hospitais, ciclos, fmt):
+        """Enfileira uma exportação e devolve o id do job"""
+        self.evict_expired()
+        hospitais, ciclos = sorted(hospitais), sorted(ciclos)
+        key = hashlib.sha1(repr((versao, hospitais, ciclos, fmt)).encode('utf-8')).hexdigest()[:16]
+
+        with self._lock:
+            job_id = self._by_key.get(key)
+            if job_id is not None and self._state(self._jobs[job_id]) != FAILED:
+                return job_id
+
+            job_id = uuid.uuid4().hex
+            path = os.path.join(self.directory, f"{key}{DOWNLOAD_FORMATS[fmt][1]}")
+            future = self._pool.submit(_export_worker, store.root, versao, hospitais, ciclos, fmt, path)
+            self._jobs[job_id] = {
+                'id': job_id,
+                'format': fmt,
+                'path': path,
+                'created': time.time(),
+                'finished': None,
+                'future': future,
+            }
+            self._by_key[key] = job_id
+            future.add_done_callback(lambda _, job_id=job_id: self._mark_finished(job_id))
+        return job_id
+
+    def _mark_finished(self, job_id):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id]['finished'] = time.time()
+
+    @staticmethod
+    def _state(job):
+        future = job['future']
+        if not future.done():
+            return RUNNING if future.running() else QUEUED
+        return FAILED if future.exception() is not None else DONE
+
+    def status(self, job_id):
+        """Estado de um job, ou ``None`` se não existe ou já expirou"""
+        self.evict_expired()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            state = self._state(job)
+            error = job['future'].exception() if state == FAILED else None
+            return {
+                'id': job_id,
+                'status': state,
+                'format': job['format'],
+                'path': job['path'] if state == DONE else None,
+                'error': str(error) if error else None,
+                'created': job['created'],
+                'finished': job['finished'],
+            }
+
+    def evict_expired(self, now=None):
+        """Remove jobs concluídos há mais de ``ttl`` segundos e seus arquivos
+
+        Arquivos do diretório sem job, deixados por processos anteriores,
+        expiram pela data de modificação.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job['finished'] is not None and now - job['finished'] > self.ttl
+            ]
+            for job_id in expired:
+                job = self._jobs.pop(job_id)
+                self._by_key = {k: v for k, v in self._by_key.items() if v != job_id}
+                if os.path.exists(job['path']):
+                    os.remove(job['path'])
+
+            # Temporários em escrita têm data recente e também ficam
+            known = {job['path'] for job in self._jobs.values()}
+            for entry in os.scandir(self.directory):
+                if not entry.is_file() or entry.path in known:
+                    continue
+                try:
+                    if now - entry.stat().st_mtime > self.ttl:
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+        return len(expired)
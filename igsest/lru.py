@@ -0,0 +1,60 @@
+"""Cache LRU em memória compartilhado entre threads, com descarte por grupo"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Guarda valores montados sob demanda, descartando os menos usados
+
+    Os valores são compartilhados entre quem os pede e não devem ser
+    alterados depois de devolvidos.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build, tag=None):
+        """Devolve o valor da chave, montando-o com ``build()`` se faltar
+
+        ``tag`` (ex.: a versão dos dados) permite descartar o grupo depois.
+        """
+        with self._lock:
+            if key in self._items:
+                self.hits += 1
+                self._items.move_to_end(key)
+                return self._items[key][1]
+            self.misses += 1
+
+        # Monta fora do lock para não serializar chamadas concorrentes
+        value = build()
+
+        with self._lock:
+            self._items[key] = (tag, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return value
+
+    def discard(self, keep):
+        """Remove os valores cujo ``tag`` não está em ``keep``"""
+        with self._lock:
+            for key in [k for k, (tag, _) in self._items.items() if tag not in keep]:
+                del self._items[key]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._items),
+                'maxsize': self.maxsize,
+            }
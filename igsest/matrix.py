@@ -0,0 +1,145 @@
+"""Matriz questão × hospital × ciclo com o status de cada avaliação
+
+O checklist é o mesmo em todos os hospitais, então os status cabem num
+array denso de ``int8`` (uns 60 KB para 63 questões, 190 hospitais e 5
+ciclos). Taxas por questão, questões mais não conformes e coocorrência de
+não conformidades saem de somas sobre os eixos e de um produto de matrizes,
+sem ``groupby``.
+"""
+
+import numpy as np
+import pandas as pd
+
+from igsest.ranking import top_k
+from igsest.schema import QUESTION_ID, STATUS
+
+# Célula sem avaliação (questão não respondida pelo hospital no ciclo)
+NAO_AVALIADA = -1
+CONFORME = STATUS.index('Conforme')
+NAO_CONFORME = STATUS.index('Não Conforme')
+
+
+def _question_order(labels):
+    """Posições das questões em ordem numérica (Q2, Q10, ...), outras por último"""
+    def key(position):
+        label = labels[position]
+        if QUESTION_ID.fullmatch(label):
+            return (0, int(label[1:]), label)
+        return (1, 0, label)
+    return sorted(range(len(labels)), key=key)
+
+
+class StatusMatrix:
+    """Status de cada questão em cada hospital e ciclo
+
+    ``status[q, h, c]`` é o código em ``STATUS`` ou ``NAO_AVALIADA``. Se um
+    hospital repete a questão no mesmo ciclo, vale a última linha.
+    """
+
+    def __init__(self, status, questions, hospitals, ciclos, descriptions=None):
+        self.status = status
+        self.questions = list(questions)
+        self.hospitals = list(hospitals)
+        self.ciclos = list(ciclos)
+        self.descriptions = descriptions
+
+    @classmethod
+    def from_compact(cls, data):
+        """Monta a matriz a partir dos códigos de um ``CompactChecklist``"""
+        questions = data.codes['questão']
+        hospitals = data.codes['hospital']
+        ciclos = data.codes['ciclo']
+        status = data.codes['status']
+        valid = (questions >= 0) & (hospitals >= 0) & (ciclos >= 0) & (status >= 0)
+
+        labels = data.labels['questão']
+        order = _question_order(labels)
+        rank = np.empty(len(labels), dtype=np.intp)
+        rank[order] = np.arange(len(labels))
+
+        matrix = np.full(
+            (len(labels), len(data.labels['hospital']), len(data.labels['ciclo'])),
+            NAO_AVALIADA, dtype=np.int8
+        )
+        matrix[rank[questions[valid]], hospitals[valid], ciclos[valid]] = status[valid]
+
+        descriptions = None
+        if data.descriptions is not None:
+            per_question, texts = data.descriptions
+            descriptions = [texts[per_question[p]] if per_question[p] >= 0 else None for p in order]
+        return cls(
+            matrix, [labels[p] for p in order], data.labels['hospital'], data.labels['ciclo'], descriptions
+        )
+
+    @property
+    def nbytes(self):
+        return self.status.nbytes
+
+    def _positions(self, labels, chosen):
+        if chosen is None:
+            return slice(None)
+        lookup = {label: i for i, label in enumerate(labels)}
+        return [lookup[v] for v in chosen if v in lookup]
+
+    def sub(self, hospitais=None, ciclos=None):
+        """Matriz questões × (hospital, ciclo) restrita aos escolhidos"""
+        status = self.status[:, self._positions(self.hospitals, hospitais), :]
+        status = status[:, :, self._positions(self.ciclos, ciclos)]
+        return status.reshape(len(self.questions), -1)
+
+    def question_rates(self, hospitais=None, ciclos=None):
+        """Avaliações, conformes e taxa (%) de cada questão na rede"""
+        status = self.sub(hospitais, ciclos)
+        avaliacoes = (status != NAO_AVALIADA).sum(axis=1)
+        conformes = (status == CONFORME).sum(axis=1)
+        nao_conformes = (status == NAO_CONFORME).sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            taxa = np.round(conformes / avaliacoes * 100, 1)
+        return pd.DataFrame({
+            'questão': self.questions,
+            'descrição': self.descriptions,
+            'avaliacoes': avaliacoes,
+            'conformes': conformes,
+            'nao_conformes': nao_conformes,
+            'taxa_conformidade': taxa,
+        })
+
+    def most_nonconforming(self, k=10, hospitais=None, ciclos=None):
+        """As ``k`` questões com mais avaliações não conformes"""
+        rates = self.question_rates(hospitais, ciclos)
+        bad = rates['nao_conformes'].to_numpy()
+        positions = top_k(bad, k)
+        positions = positions[bad[positions] > 0]
+        worst = rates.iloc[positions].reset_index(drop=True)
+        worst['taxa_nao_conformidade'] = (worst['nao_conformes'] / worst['avaliacoes'] * 100).round(1)
+        return worst[['questão', 'descrição', 'nao_conformes', 'avaliacoes', 'taxa_nao_conformidade']]
+
+    def cooccurrence(self, hospitais=None, ciclos=None):
+        """Quantas avaliações (hospital, ciclo) têm as duas questões não conformes
+
+        Sai de um único produto ``X @ X.T`` sobre a matriz de não
+        conformidades; a diagonal é o total de cada questão.
+        """
+        bad = (self.sub(hospitais, ciclos) == NAO_CONFORME).astype(np.float32)
+        counts = (bad @ bad.T).round().astype(np.int64)
+        return pd.DataFrame(counts, index=self.questions, columns=self.questions)
+
+    def cooccurring_pairs(self, k=10, hospitais=None, ciclos=None):
+        """Pares de questões que mais aparecem não conformes juntos
+
+        ``jaccard`` é a fração (%) das avaliações com alguma das duas não
+        conforme em que as duas estão.
+        """
+        counts = self.cooccurrence(hospitais, ciclos).to_numpy()
+        first, second = np.triu_indices(len(self.questions), 1)
+        together = counts[first, second]
+        positions = top_k(together, k)
+        positions = positions[together[positions] > 0]
+        first, second, together = first[positions], second[positions], together[positions]
+        either = counts[first, first] + counts[second, second] - together
+        return pd.DataFrame({
+            'questão_a': [self.questions[i] for i in first],
+            'questão_b': [self.questions[i] for i in second],
+            'juntas': together,
+            'jaccard': np.round(together / either * 100, 1),
+        })
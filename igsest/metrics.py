@@ -0,0 +1,34 @@
+"""Métricas de conformidade calculadas a partir do cubo de contagens"""
+
+import pandas as pd
+
+# Taxa de conformidade de referência da rede EBSERH (%)
+PADRAO_EBSERH = 95.65
+
+
+def calculate_metrics(cube):
+    """Calcula métricas principais a partir do cubo de contagens
+
+    Sem questões na seleção, a taxa de conformidade é ``NaN``.
+    """
+    por_status = cube.totals('status')
+    total_questoes = int(por_status.sum())
+    conformes = int(por_status.get('Conforme', 0))
+    nao_conformes = int(por_status.get('Não Conforme', 0))
+    taxa_conformidade = conformes / total_questoes * 100 if total_questoes else float('nan')
+
+    # Métricas por dimensão
+    por_dimensao = cube.totals(['dimensão', 'status']).unstack(fill_value=0)
+    dim_metrics = pd.DataFrame({
+        'total': por_dimensao.sum(axis=1),
+        'conformes': por_dimensao.get('Conforme', 0)
+    })
+    dim_metrics['taxa'] = (dim_metrics['conformes'] / dim_metrics['total'] * 100).round(1)
+
+    return {
+        'total': total_questoes,
+        'conformes': conformes,
+        'nao_conformes': nao_conformes,
+        'taxa_conformidade': taxa_conformidade,
+        'dimensoes': dim_metrics
+    }
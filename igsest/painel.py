@@ -0,0 +1,792 @@
+"""Interface Streamlit do painel, compartilhada por app.py e base.py
+
+Os dois scripts servem a mesma página e os mesmos caches; só mudam título,
+ícone, rótulos das colunas e o botão de atualização.
+"""
+
+import hmac
+import os
+import tempfile
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from igsest.charts import create_overview_charts, create_priority_chart
+from igsest.export import DOWNLOAD_FORMATS, XLSX_MIME, DownloadCache
+from igsest.figcache import FigureCache, filter_key
+from igsest.instrument import RerunLog, RerunProfile
+from igsest.jobs import DONE, FAILED, ExportJobs
+from igsest.metrics import PADRAO_EBSERH, calculate_metrics
+from igsest.matrix import StatusMatrix
+from igsest.ranking import GERAL, NetworkRanking
+from igsest.simulation import RemediationPlan
+from igsest.schema import LABELS, PLAIN_LABELS, PRIORIDADES, display
+from igsest.scoring import PESOS_FONTE, PESOS_PRIORIDADE, WeightedScores, WeightProfile
+from igsest.snapshot import default_view, trend_figure, view_snapshot
+from igsest.store import open_store
+from igsest.table import TableCursor, style_status
+from igsest.trends import TREND_SERIES
+from igsest.versions import DataVersions
+
+# Variações da página servidas por app.py e base.py
+VARIANTES = {
+    'painel': {
+        'page_title': "IG-SEST Painel - MEJC-UFRN",
+        'page_icon': "",
+        'titulo': " Painel IG-SEST",
+        'rotulos': {},
+        'botao_atualizar': False
+    },
+    'dashboard': {
+        'page_title': "IG-SEST Dashboard - MEJC-UFRN",
+        'page_icon': "🏥",
+        'titulo': "🏥 Dashboard IG-SEST",
+        'rotulos': PLAIN_LABELS,
+        'botao_atualizar': True
+    }
+}
+
+def configure_page(page_title, page_icon):
+    """Configuração da página e CSS customizado"""
+    
+    st.set_page_config(
+        page_title=page_title,
+        page_icon=page_icon,
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # CSS customizado
+    st.markdown("""
+<style>
+    .main-header {
+        background: linear-gradient(90deg, #2c5aa0 0%, #1e3c72 100%);
+        padding: 2rem;
+        border-radius: 10px;
+        color: white;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    
+    .metric-card {
+        background: white;
+        padding: 1rem;
+        border-radius: 8px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        border-left: 4px solid #2c5aa0;
+    }
+    
+    .conforme {
+        color: #28a745;
+        font-weight: bold;
+    }
+    
+    .nao-conforme {
+        color: #dc3545;
+        font-weight: bold;
+    }
+    
+    .dimension-header {
+        background: #f8f9fa;
+        padding: 1rem;
+        border-left: 4px solid #2c5aa0;
+        margin: 1rem 0;
+        border-radius: 5px;
+    }
+</style>
+    """, unsafe_allow_html=True)
+
+# Dados das conformidades
+@st.cache_resource
+def get_store():
+    """Abre o armazém de conformidades particionado por hospital e ciclo"""
+    
+    return open_store()
+
+@st.cache_resource
+def get_figure_cache():
+    """Cache de figuras compartilhado por todas as sessões"""
+    
+    return FigureCache(maxsize=256)
+
+@st.cache_resource
+def get_versions():
+    """Versão ativa dos dados, compartilhada entre sessões
+
+    A visão padrão de cada versão nova é preparada antes da troca; ao
+    trocar, só as figuras da versão antiga são descartadas.
+    """
+    
+    store = get_store()
+    versions = DataVersions(store)
+    figure_cache = get_figure_cache()
+    versions.on_warm(lambda data: view_snapshot(store, data))
+    versions.on_switch(lambda nova, antiga: figure_cache.discard(keep={nova}))
+    return versions
+
+@st.cache_resource
+def get_download_cache():
+    """Arquivos de download gerados sob demanda, compartilhados entre sessões"""
+    
+    return DownloadCache(os.path.join(tempfile.gettempdir(), 'igsest-downloads'))
+
+@st.cache_resource
+def get_export_jobs():
+    """Fila de exportações em segundo plano, compartilhada entre sessões"""
+    
+    return ExportJobs(os.path.join(tempfile.gettempdir(), 'igsest-exports'))
+
+@st.cache_resource
+def get_rerun_log():
+    """Últimas execuções medidas, compartilhadas entre sessões"""
+    
+    return RerunLog()
+
+def is_admin():
+    """Painel de desempenho só aparece com ?admin=<IGSEST_ADMIN_TOKEN> na URL"""
+    
+    token = os.environ.get('IGSEST_ADMIN_TOKEN')
+    # Comparação em tempo constante, para não vazar o token pelo tempo de resposta
+    return bool(token) and hmac.compare_digest(st.query_params.get('admin', ''), token)
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+def show_export_result(job):
+    """Resultado de um job de exportação concluído, ou aviso se expirou"""
+    
+    if job is None:
+        st.warning("O relatório expirou. Gere-o novamente.")
+    elif job['status'] == DONE:
+        st.download_button(
+            label="⬇️ Download Excel",
+            data=lambda: read_file(job['path']),
+            file_name=f"IGSEST_MEJC_UFRN_{datetime.now().strftime('%Y%m%d')}.xlsx",
+            mime=XLSX_MIME
+        )
+    else:
+        st.error(f"Falha ao gerar o relatório: {job['error']}")
+
+@st.fragment(run_every=2)
+def show_export_job(job_id):
+    """Acompanha o job em preparação; ao terminar recarrega a página, que para de consultar"""
+    
+    job = get_export_jobs().status(job_id)
+    if job is None or job['status'] in (DONE, FAILED):
+        st.rerun()
+    st.info("⏳ Relatório em preparação...")
+
+@st.fragment(run_every=2)
+def show_refresh(versao):
+    """Acompanha a preparação da nova versão e recarrega a página na troca"""
+    
+    versions = get_versions()
+    if versions.active().versao != versao:
+        del st.session_state['atualizando']
+        st.rerun()
+    elif versions.warming() is not None:
+        st.info("⏳ Preparando a nova versão dos dados...")
+    else:
+        del st.session_state['atualizando']
+        if versions.last_error:
+            st.error(f"Falha ao atualizar os dados: {versions.last_error}")
+
+def render_table(df, key, columns, signature, rename=None, style=False, page_size=50, height="auto"):
+    """Mostra uma tabela paginada no servidor, com busca e ordenação"""
+    
+    rename = rename or {}
+    
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        busca = st.text_input("Buscar:", key=f"{key}_busca")
+    with col2:
+        ordenar = st.selectbox(
+            "Ordenar por:",
+            options=[None] + columns,
+            format_func=lambda c: "—" if c is None else rename.get(c, c),
+            key=f"{key}_ordem"
+        )
+    with col3:
+        decrescente = st.checkbox("Decrescente", key=f"{key}_desc")
+    
+    # Cursor reaproveitado enquanto dados, filtros, busca e ordem não mudam
+    estado = (signature, busca, ordenar, decrescente)
+    anterior = st.session_state.get(f"{key}_cursor")
+    if anterior is None or anterior[0] != estado:
+        cursor = TableCursor(df, ordenar, not decrescente, busca, search_columns=['questão', 'descrição'])
+        st.session_state[f"{key}_cursor"] = (estado, cursor)
+    else:
+        cursor = anterior[1]
+    
+    total_paginas = cursor.page_count(page_size)
+    pagina = st.number_input(
+        "Página:", min_value=1, max_value=total_paginas, value=1, step=1, key=f"{key}_pagina"
+    )
+    
+    # Só a página visível é recortada, renomeada, estilizada e enviada
+    df_page = display(cursor.page(df, pagina, page_size)[columns], rename)
+    if style:
+        df_page = style_status(df_page, rename.get('status', 'status'))
+    st.dataframe(df_page, use_container_width=True, height=height)
+    st.caption(f"Página {pagina} de {total_paginas} · {len(cursor)} questões")
+
+def show_perf_panel(resumo):
+    """Tempos da execução atual, acertos de cache e execuções mais lentas"""
+    
+    caches = {
+        'selecoes': get_versions().active().stats(),
+        'figuras': get_figure_cache().stats(),
+        'downloads': get_download_cache().stats()
+    }
+    
+    with st.sidebar.expander("⏱️ Desempenho (admin)"):
+        st.caption(f"Execução atual: {resumo['total'] * 1000:.0f} ms")
+        st.dataframe(
+            pd.DataFrame({
+                'Etapa': list(resumo['spans']),
+                'ms': [round(t * 1000, 1) for t in resumo['spans'].values()]
+            }),
+            hide_index=True
+        )
+        
+        st.markdown("**Caches**")
+        st.dataframe(pd.DataFrame(caches).T[['hits', 'misses']])
+        
+        st.markdown("**Execuções mais lentas**")
+        st.dataframe(
+            pd.DataFrame([
+                {'Início': r['started'], 'ms': round(r['total'] * 1000, 1)}
+                for r in get_rerun_log().slowest(5)
+            ]),
+            hide_index=True
+        )
+        
+        st.checkbox("Capturar cProfile nas próximas execuções", key='perfil_cprofile')
+        if resumo['profile']:
+            st.code(resumo['profile'], language=None)
+        
+        st.download_button(
+            label="Exportar medições (JSON)",
+            data=get_rerun_log().to_json(caches=caches),
+            file_name=f"desempenho_{datetime.now().strftime('%Y%m%d_%H%M')}.json",
+            mime="application/json"
+        )
+
+# APLICAÇÃO PRINCIPAL
+def main(titulo, rotulos, botao_atualizar=False):
+    admin = is_admin()
+    perf = RerunProfile(profile=admin and st.session_state.get('perfil_cprofile', False))
+    
+    # Header
+    st.markdown(f"""
+    <div class="main-header">
+        <h1>{titulo}</h1>
+        <h3>Maternidade Escola Januário Cicco - UFRN</h3>
+        <p>Análise de Conformidades em Governança Corporativa</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Sidebar
+    st.sidebar.title("🔧 Filtros e Controles")
+    
+    # Versão ativa dos dados; uma versão nova é preparada em segundo plano
+    store = get_store()
+    with perf.span('carga_dados'):
+        versions = get_versions()
+        versions.check()
+        atual = versions.active()
+        versao = atual.versao
+    
+    # Opções vêm da versão carregada, não do diretório do armazém
+    hospitais_padrao, _ = default_view(atual)
+    hospitais_selecionados = st.sidebar.multiselect(
+        "Hospitais:",
+        options=atual.hospitals(),
+        default=hospitais_padrao
+    )
+    
+    ciclos_disponiveis = atual.cycles(hospitais_selecionados)
+    ciclos_selecionados = st.sidebar.multiselect(
+        "Ciclos de avaliação:",
+        options=ciclos_disponiveis,
+        default=ciclos_disponiveis[-1:]
+    )
+    
+    # A visão padrão vem pronta, montada uma vez por versão dos dados
+    with perf.span('visao_padrao'):
+        snapshot = view_snapshot(store, atual)
+        if snapshot is not None and not snapshot.matches(hospital=hospitais_selecionados, ciclo=ciclos_selecionados):
+            snapshot = None
+    
+    # Linhas e índice de filtros guardados por seleção na versão: nenhum
+    # dos dois é remontado a cada interação
+    with perf.span('carga_dados'):
+        df, index = atual.selection(hospitais_selecionados, ciclos_selecionados)
+    if df.empty:
+        st.warning("Selecione ao menos um hospital e um ciclo com dados.")
+        st.stop()
+    # Na visão padrão as opções dos filtros também vêm prontas
+    opcoes = snapshot.filters if snapshot is not None else {
+        column: index.options(column) for column in ('dimensão', 'status', 'prioridade')
+    }
+    
+    with perf.span('metricas'):
+        if snapshot is not None:
+            metrics = snapshot.metrics
+        else:
+            metrics = calculate_metrics(
+                atual.cube.select(hospital=hospitais_selecionados, ciclo=ciclos_selecionados)
+            )
+    
+    # Filtros
+    dimensoes_selecionadas = st.sidebar.multiselect(
+        "Dimensões:",
+        options=opcoes['dimensão'],
+        default=opcoes['dimensão']
+    )
+    
+    status_selecionado = st.sidebar.multiselect(
+        "Status:",
+        options=opcoes['status'],
+        default=opcoes['status']
+    )
+    
+    prioridade_selecionada = st.sidebar.multiselect(
+        "Prioridade:",
+        options=opcoes['prioridade'],
+        default=opcoes['prioridade']
+    )
+    
+    # Pesos da pontuação ponderada; cada perfil é calculado uma vez por versão
+    with st.sidebar.expander("⚖️ Pesos da Pontuação"):
+        pesos_prioridade = {
+            p: st.number_input(f"Prioridade {p}", min_value=0.0, value=PESOS_PRIORIDADE[p], step=0.5, key=f"peso_{p}")
+            for p in PRIORIDADES
+        }
+        pesos_fonte = {
+            f: st.number_input(f, min_value=0.0, value=PESOS_FONTE[f], step=0.5, key=f"peso_{f}")
+            for f in PESOS_FONTE
+        }
+    perfil = WeightProfile(pesos_prioridade, pesos_fonte)
+    
+    # Filtrar dados
+    with perf.span('filtros'):
+        df_filtered = index.filter(
+            df,
+            dimensão=dimensoes_selecionadas,
+            status=status_selecionado,
+            prioridade=prioridade_selecionada
+        )
+    
+    # Gráficos respondidos pelo cubo, sem percorrer as linhas
+    estado_filtros = dict(
+        hospital=hospitais_selecionados,
+        ciclo=ciclos_selecionados,
+        dimensão=dimensoes_selecionadas,
+        status=status_selecionado,
+        prioridade=prioridade_selecionada
+    )
+    if snapshot is not None and not snapshot.matches(**estado_filtros):
+        snapshot = None
+    figure_cache = get_figure_cache()
+    
+    def figura(nome, chave, build):
+        """Figura da visão padrão, ou do cache de figuras nas demais"""
+        if snapshot is not None:
+            return snapshot.figure(nome)
+        return figure_cache.get_or_build(chave, build, tag=versao)
+    
+    # Métricas principais
+    st.markdown("## 📊 Métricas Principais")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            label="Total de Questões",
+            value=metrics['total'],
+            delta=None
+        )
+    
+    with col2:
+        st.metric(
+            label="Questões Conformes",
+            value=metrics['conformes'],
+            delta=f"{metrics['taxa_conformidade']:.1f}%"
+        )
+    
+    with col3:
+        st.metric(
+            label="Não Conformes",
+            value=metrics['nao_conformes'],
+            delta=f"-{100-metrics['taxa_conformidade']:.1f}%"
+        )
+    
+    with col4:
+        # Comparação com padrão EBSERH
+        delta_ebserh = metrics['taxa_conformidade'] - PADRAO_EBSERH
+        st.metric(
+            label="vs. Padrão EBSERH",
+            value=f"{metrics['taxa_conformidade']:.1f}%",
+            delta=f"{delta_ebserh:.1f}%"
+        )
+    
+    # Pontuação ponderada por prioridade e fonte
+    st.markdown("## ⚖️ Pontuação Ponderada")
+    
+    with perf.span('pontuacao'):
+        pontuacao = atual.cached('pontuacao', lambda: WeightedScores(atual.cube))
+        nota = pontuacao.score(perfil, hospitais_selecionados, ciclos_selecionados)
+        ciclo_recente = max(ciclos_selecionados)
+        notas_rede = pontuacao.by_hospital(perfil, ciclo_recente)
+    
+    # Com todos os pesos zerados não há pontuação: mostra "—", não "nan%"
+    if pd.isna(nota):
+        st.warning("Os pesos das questões selecionadas estão todos zerados; ajuste-os na barra lateral.")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            label="Pontuação Ponderada",
+            value="—" if pd.isna(nota) else f"{nota:.1f}%",
+            delta=None if pd.isna(nota) else f"{nota - metrics['taxa_conformidade']:+.1f} p.p. vs. taxa simples"
+        )
+    
+    with col2:
+        st.metric(
+            label=f"Média da Rede ({ciclo_recente})",
+            value="—" if notas_rede.empty else f"{notas_rede.mean():.1f}%"
+        )
+    
+    with col3:
+        hospital = hospitais_selecionados[0]
+        if hospital in notas_rede.index:
+            st.metric(
+                label=f"Posição de {hospital} ({ciclo_recente})",
+                value=f"{int((notas_rede > notas_rede[hospital]).sum()) + 1}º de {len(notas_rede)}"
+            )
+    
+    st.caption("Cada questão pesa prioridade × fonte; ajuste os pesos na barra lateral.")
+    
+    # Gráficos principais
+    st.markdown("## 📈 Visão Geral")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1, perf.span('graficos'):
+        fig_pie, fig_bar = figura(
+            'visao_geral',
+            filter_key('visao_geral', versao, **estado_filtros),
+            lambda: create_overview_charts(atual.cube.select(**estado_filtros))
+        )
+        st.plotly_chart(fig_pie, use_container_width=True)
+    
+    with col2, perf.span('graficos'):
+        st.plotly_chart(fig_bar, use_container_width=True)
+    
+    # Gráfico de prioridades
+    st.markdown("## ⚠️ Análise de Prioridades")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1, perf.span('graficos'):
+        fig_priority = figura(
+            'prioridades',
+            filter_key('prioridades', versao, **estado_filtros),
+            lambda: create_priority_chart(atual.cube.select(**estado_filtros))
+        )
+        st.plotly_chart(fig_priority, use_container_width=True)
+    
+    with col2:
+        st.markdown("### Principais Não Conformidades")
+        alta_prioridade = df_filtered[
+            (df_filtered['status'] == 'Não Conforme') & 
+            (df_filtered['prioridade'] == 'Alta')
+        ]
+        
+        for _, row in alta_prioridade.head(5).iterrows():
+            st.markdown(f"**{row['questão']}:** {row['descrição'][:50]}...")
+    
+    # Simulação de um plano de correção sobre as contagens da seleção
+    st.markdown("## 🛠️ Simulação de Plano de Correção")
+    
+    with perf.span('simulacao'):
+        # O plano fica na sessão; cada execução aplica só as questões que mudaram
+        assinatura = (versao, tuple(hospitais_selecionados), tuple(ciclos_selecionados))
+        anterior = st.session_state.get('plano_correcao')
+        if anterior is None or anterior[0] != assinatura:
+            plano = RemediationPlan(
+                atual.cube.select(hospital=hospitais_selecionados, ciclo=ciclos_selecionados), df
+            )
+            st.session_state['plano_correcao'] = (assinatura, plano)
+            st.session_state.pop('questoes_plano', None)
+        else:
+            plano = anterior[1]
+        
+        questoes_plano = st.multiselect(
+            "Questões não conformes tratadas como corrigidas:",
+            options=plano.candidates(),
+            format_func=lambda q: f"{q} ({plano.priority(q)}) - {plano.descriptions.get(q, '')[:60]}",
+            key='questoes_plano'
+        )
+        plano.set_resolved(questoes_plano)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            label="Taxa Projetada",
+            value=f"{plano.rate:.1f}%",
+            delta=f"{plano.rate - metrics['taxa_conformidade']:+.1f} p.p."
+        )
+    
+    with col2:
+        st.metric(
+            label="vs. Padrão EBSERH",
+            value=f"{PADRAO_EBSERH}%",
+            delta=f"{plano.rate - PADRAO_EBSERH:.1f}%"
+        )
+    
+    with col3:
+        st.metric(label="Avaliações a Corrigir para o Padrão", value=plano.needed())
+    
+    if questoes_plano:
+        with perf.span('simulacao'):
+            projetadas = plano.metrics()
+            fig_pie, fig_bar = create_overview_charts(plano.cube())
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(fig_pie, use_container_width=True)
+        with col2:
+            st.plotly_chart(fig_bar, use_container_width=True)
+        
+        st.dataframe(
+            pd.DataFrame({
+                'Taxa Atual (%)': metrics['dimensoes']['taxa'],
+                'Taxa Projetada (%)': projetadas['dimensoes']['taxa']
+            }).rename_axis('Dimensão'),
+            use_container_width=True
+        )
+    
+    # Evolução entre ciclos: todos os ciclos, calculada sobre o cubo
+    st.markdown("## 📉 Evolução entre Ciclos")
+    
+    estado_tendencia = dict(dimensão=dimensoes_selecionadas, prioridade=prioridade_selecionada)
+    abas = st.tabs([aba for _, aba, _ in TREND_SERIES])
+    for aba, (por, _, titulo) in zip(abas, TREND_SERIES):
+        with aba, perf.span('tendencias'):
+            chave = filter_key(
+                f"tendencia_{por}", versao,
+                hospital=None if por is None else hospitais_selecionados,
+                **estado_tendencia
+            )
+            fig_trend = figura(
+                f"tendencia_{por}",
+                chave,
+                lambda: trend_figure(atual.cube, por, titulo, hospitais_selecionados, **estado_tendencia)
+            )
+            st.plotly_chart(fig_trend, use_container_width=True)
+    
+    # Ranking da rede no ciclo mais recente entre os escolhidos
+    st.markdown("## 🏆 Ranking da Rede")
+    
+    with perf.span('ranking'):
+        ciclo_ranking = max(ciclos_selecionados)
+        ranking = atual.cached(
+            ('ranking', ciclo_ranking),
+            lambda: NetworkRanking(atual.cube, ciclo_ranking)
+        )
+        dimensao_ranking = st.selectbox(
+            f"Ranking do ciclo {ciclo_ranking} por:",
+            options=[GERAL] + [d for d in ranking.dimensions if d != GERAL]
+        )
+        
+        colunas_ranking = {
+            'hospital': 'Hospital',
+            'taxa': 'Taxa (%)',
+            'percentil': 'Percentil',
+            'distancia_padrao': f'Distância ao padrão {PADRAO_EBSERH}% (p.p.)'
+        }
+        
+        posicoes = st.columns(min(len(hospitais_selecionados), 4) or 1)
+        for coluna, hospital in zip(posicoes, hospitais_selecionados[:4]):
+            posicao, total_ranqueados = ranking.position(hospital, dimensao_ranking)
+            with coluna:
+                if posicao is None:
+                    st.metric(hospital, "—")
+                else:
+                    st.metric(
+                        hospital,
+                        f"{posicao}º de {total_ranqueados}",
+                        delta=f"{ranking.gaps.loc[hospital, dimensao_ranking]:+.1f} p.p. vs. padrão"
+                    )
+        st.caption(
+            f"{ranking.above_standard(dimensao_ranking)} de {len(ranking.hospitals)} hospitais "
+            f"atingem o padrão EBSERH de {PADRAO_EBSERH}%"
+        )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("### Melhores Hospitais")
+            st.dataframe(
+                ranking.top(10, dimensao_ranking).round(1).rename(columns=colunas_ranking),
+                hide_index=True, use_container_width=True
+            )
+        with col2:
+            st.markdown("### Piores Hospitais")
+            st.dataframe(
+                ranking.top(10, dimensao_ranking, worst=True).round(1).rename(columns=colunas_ranking),
+                hide_index=True, use_container_width=True
+            )
+        
+        # Questão × hospital × ciclo: as análises por questão saem da matriz
+        matriz = atual.cached('matriz_status', lambda: StatusMatrix.from_compact(atual.data))
+        
+        st.markdown("### Questões com Mais Não Conformidades na Rede")
+        piores_questoes = atual.cached(
+            ('piores_questoes', ciclo_ranking),
+            lambda: matriz.most_nonconforming(10, ciclos=[ciclo_ranking])
+        )
+        st.dataframe(
+            piores_questoes.rename(columns={
+                'questão': 'Questão',
+                'descrição': 'Descrição',
+                'nao_conformes': 'Hospitais Não Conformes',
+                'avaliacoes': 'Hospitais Avaliados',
+                'taxa_nao_conformidade': 'Não Conformidade (%)'
+            }),
+            hide_index=True, use_container_width=True
+        )
+        
+        st.markdown("### Não Conformidades que Ocorrem Juntas")
+        pares = atual.cached(
+            ('pares_nao_conformes', ciclo_ranking),
+            lambda: matriz.cooccurring_pairs(10, ciclos=[ciclo_ranking])
+        )
+        st.dataframe(
+            pares.rename(columns={
+                'questão_a': 'Questão',
+                'questão_b': 'Questão Associada',
+                'juntas': 'Hospitais com Ambas',
+                'jaccard': 'Coocorrência (%)'
+            }),
+            hide_index=True, use_container_width=True
+        )
+    
+    # Performance por dimensão
+    st.markdown("## 🎯 Performance por Dimensão")
+    
+    for dim in metrics['dimensoes'].index:
+        # Expander com estado: a tabela só é montada quando está aberto
+        expander = st.expander(
+            f"{dim} - {metrics['dimensoes'].loc[dim, 'taxa']}% de conformidade",
+            key=f"exp_{dim}",
+            on_change="rerun"
+        )
+        with expander:
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("Total", int(metrics['dimensoes'].loc[dim, 'total']))
+            with col2:
+                st.metric("Conformes", int(metrics['dimensoes'].loc[dim, 'conformes']))
+            with col3:
+                st.metric("Taxa", f"{metrics['dimensoes'].loc[dim, 'taxa']}%")
+            
+            # Tabela detalhada da dimensão
+            if expander.open:
+                with perf.span('tabelas'):
+                    render_table(
+                        index.filter(df, dimensão=[dim]),
+                        key=f"tab_{dim}",
+                        columns=['questão', 'descrição', 'status', 'prioridade', 'fonte'],
+                        signature=(versao, tuple(hospitais_selecionados), tuple(ciclos_selecionados)),
+                        rename=rotulos,
+                        page_size=20
+                    )
+    
+    # Tabela completa
+    st.markdown("## 📋 Tabela Detalhada")
+    
+    # Renomear colunas com acentos e maiúsculas
+    with perf.span('tabelas'):
+        render_table(
+            df_filtered,
+            key="tab_detalhada",
+            columns=list(df_filtered.columns),
+            signature=filter_key('tabela', versao, **estado_filtros),
+            rename=LABELS,
+            style=True,
+            height=400
+        )
+    
+    # Exportação
+    st.markdown("## 💾 Exportação de Dados")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        # O relatório é gerado em outro processo; a página só acompanha o job
+        if st.button("📊 Gerar Relatório Excel", type="primary"):
+            st.session_state['job_excel'] = get_export_jobs().submit(
+                store, versao, hospitais_selecionados, ciclos_selecionados, 'xlsx'
+            )
+        if 'job_excel' in st.session_state:
+            job = get_export_jobs().status(st.session_state['job_excel'])
+            if job is not None and job['status'] not in (DONE, FAILED):
+                show_export_job(job['id'])
+            else:
+                show_export_result(job)
+    
+    with col2:
+        formato = st.selectbox(
+            "Formato:",
+            options=['csv', 'csv.gz', 'parquet'],
+            format_func={'csv': 'CSV', 'csv.gz': 'CSV compactado (gzip)', 'parquet': 'Parquet'}.get
+        )
+        mime, extensao = DOWNLOAD_FORMATS[formato]
+        
+        # O arquivo só é gerado quando alguém clica, e fica guardado por versão
+        chave_download = filter_key('download', versao, hospital=hospitais_selecionados, ciclo=ciclos_selecionados)
+        st.download_button(
+            label="📄 Download Dados",
+            data=lambda: get_download_cache().read(chave_download, formato, df),
+            file_name=f"conformidades_mejc_{datetime.now().strftime('%Y%m%d')}{extensao}",
+            mime=mime
+        )
+    
+    with col3:
+        # Só procura uma versão nova; os caches das demais versões continuam
+        if botao_atualizar and st.button("🔄 Atualizar Dados"):
+            if versions.check(force=True) is None:
+                st.info("Os dados já estão na versão mais recente.")
+            else:
+                st.session_state['atualizando'] = True
+        if st.session_state.get('atualizando'):
+            show_refresh(versao)
+    
+    # Footer
+    st.markdown("---")
+    st.markdown(
+        "<div style='text-align: center; color: gray;'>"
+        f"Relatório gerado em {datetime.now().strftime('%d/%m/%Y %H:%M')} | "
+        "Maternidade Escola Januário Cicco - UFRN"
+        "</div>",
+        unsafe_allow_html=True
+    )
+    
+    resumo = perf.finish()
+    get_rerun_log().append(resumo)
+    if admin:
+        show_perf_panel(resumo)
+
+def run(variante='painel'):
+    """Monta a página na variação pedida"""
+    
+    config = VARIANTES[variante]
+    configure_page(config['page_title'], config['page_icon'])
+    main(config['titulo'], config['rotulos'], config['botao_atualizar'])
@@ -0,0 +1,82 @@
+"""Ranking dos hospitais da rede frente ao padrão EBSERH
+
+As taxas saem do cubo de contagens (uma linha por hospital, uma coluna por
+dimensão). Percentis e distâncias ao padrão são calculados de uma vez; as
+listas de melhores e piores usam seleção parcial, sem ordenar a rede toda.
+"""
+
+import numpy as np
+import pandas as pd
+
+from igsest.metrics import PADRAO_EBSERH
+from igsest.schema import STATUS
+
+GERAL = 'Geral'
+
+
+def top_k(values, k, largest=True):
+    """Posições dos ``k`` maiores (ou menores) valores, já em ordem
+
+    Usa ``np.argpartition``; só os ``k`` escolhidos são ordenados. Valores
+    ``NaN`` ficam por último nos dois sentidos.
+    """
+    values = np.asarray(values, dtype=float)
+    k = min(k, len(values))
+    if k <= 0:
+        return np.array([], dtype=int)
+    key = -values if largest else values.copy()
+    key[np.isnan(key)] = np.inf
+    chosen = np.argpartition(key, k - 1)[:k]
+    return chosen[np.argsort(key[chosen], kind='stable')]
+
+
+class NetworkRanking:
+    """Taxa de conformidade de cada hospital num ciclo, geral e por dimensão"""
+
+    def __init__(self, cube, ciclo, padrao=PADRAO_EBSERH):
+        self.ciclo = ciclo
+        self.padrao = padrao
+
+        counts = cube.select(ciclo=[ciclo]).totals(['hospital', 'dimensão', 'status'])
+        counts = counts.unstack('status', fill_value=0).reindex(columns=STATUS, fill_value=0)
+        conformes = counts['Conforme'].unstack('dimensão', fill_value=0)
+        total = counts.sum(axis=1).unstack('dimensão', fill_value=0)
+        conformes[GERAL] = conformes.sum(axis=1)
+        total[GERAL] = total.sum(axis=1)
+
+        self.rates = (conformes / total * 100).where(total > 0)
+        self.percentiles = self.rates.rank(pct=True) * 100
+        self.gaps = self.rates - padrao
+
+    @property
+    def hospitals(self):
+        return list(self.rates.index)
+
+    @property
+    def dimensions(self):
+        return list(self.rates.columns)
+
+    def table(self, positions, column=GERAL):
+        rates = self.rates[column].to_numpy()
+        return pd.DataFrame({
+            'hospital': self.rates.index[positions],
+            'taxa': rates[positions],
+            'percentil': self.percentiles[column].to_numpy()[positions],
+            'distancia_padrao': self.gaps[column].to_numpy()[positions],
+        })
+
+    def top(self, k=10, column=GERAL, worst=False):
+        """Os ``k`` melhores (ou piores) hospitais na coluna"""
+        return self.table(top_k(self.rates[column].to_numpy(), k, largest=not worst), column)
+
+    def position(self, hospital, column=GERAL):
+        """Posição do hospital no ranking (1 = maior taxa) e o total ranqueado"""
+        rates = self.rates[column]
+        if hospital not in rates.index or np.isnan(rates[hospital]):
+            return None, int(rates.notna().sum())
+        return int((rates > rates[hospital]).sum()) + 1, int(rates.notna().sum())
+
+    def above_standard(self, column=GERAL):
+        """Quantos hospitais atingem o padrão"""
+        return int((self.gaps[column] >= 0).sum())
+
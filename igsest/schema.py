@@ -0,0 +1,116 @@
+"""Esquema único do checklist: nomes internos, tipos e rótulos de exibição
+
+Internamente as colunas têm sempre os nomes acentuados de ``COLUMNS`` e as
+colunas de domínio fechado são categóricas, ou seja, códigos inteiros
+compactos mais a tabela de rótulos. Nomes sem acento e rótulos com
+maiúsculas só são aplicados na saída, por ``display``.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# Colunas do checklist, na ordem de exibição
+COLUMNS = ['questão', 'descrição', 'dimensão', 'fonte', 'status', 'prioridade']
+
+# Colunas guardadas como códigos inteiros (categorias)
+CODED_COLUMNS = ['questão', 'descrição', 'dimensão', 'fonte', 'status', 'prioridade']
+
+STATUS = ['Conforme', 'Não Conforme']
+PRIORIDADES = ['Alta', 'Média', 'Baixa']
+
+# Vocabulários fixos: os códigos seguem esta ordem, não a ordem alfabética
+FIXED_LABELS = {'status': STATUS, 'prioridade': PRIORIDADES}
+
+# Cabeçalhos sem acento (como em base.py) aceitos na entrada
+ALIASES = {
+    'questao': 'questão',
+    'descricao': 'descrição',
+    'dimensao': 'dimensão',
+}
+
+# Identificador de questão do checklist (Q2, Q89, ...)
+QUESTION_ID = re.compile(r'Q[1-9][0-9]*')
+
+# Colunas que não podem ficar vazias
+REQUIRED_COLUMNS = ['questão', 'dimensão', 'status', 'prioridade']
+
+# Rótulos de exibição da tabela detalhada
+LABELS = {
+    'hospital': 'Hospital',
+    'ciclo': 'Ciclo',
+    'questão': 'Questão',
+    'descrição': 'Descrição',
+    'dimensão': 'Dimensão',
+    'fonte': 'Fonte',
+    'status': 'Status',
+    'prioridade': 'Prioridade',
+}
+
+# Cabeçalhos sem acento, exibidos pelo base.py
+PLAIN_LABELS = {internal: plain for plain, internal in ALIASES.items()}
+
+
+def dtype(column):
+    """Tipo pandas usado para uma coluna do checklist"""
+    if column in FIXED_LABELS:
+        return pd.CategoricalDtype(FIXED_LABELS[column])
+    if column in CODED_COLUMNS:
+        return 'category'
+    return 'string'
+
+
+def normalize(name):
+    """Nome interno de um cabeçalho de entrada"""
+    name = str(name).strip().lower()
+    return ALIASES.get(name, name)
+
+
+def with_dtypes(df):
+    """Aplica os tipos do esquema às colunas conhecidas"""
+    return df.astype({c: dtype(c) for c in df.columns if c in COLUMNS})
+
+
+def display(df, labels=LABELS):
+    """Renomeia as colunas internas para os rótulos de exibição"""
+    return df.rename(columns=labels)
+
+
+def validate(df, questions=None, max_errors=20):
+    """Problemas encontrados nas linhas de texto de ``df``; lista vazia se válido
+
+    Confere campos obrigatórios, o formato e a unicidade dos identificadores
+    de questão (e, se ``questions`` for dado, se pertencem ao checklist) e os
+    valores permitidos de status e prioridade. As linhas são numeradas como
+    na planilha, com o cabeçalho na linha 1.
+    """
+    errors = []
+    lines = np.arange(2, len(df) + 2)
+
+    def report(mask, column, message):
+        mask = mask.to_numpy(dtype=bool)
+        for line, value in zip(lines[mask], df[column][mask]):
+            errors.append((line, f"linha {line}: {message.format(value=value)}"))
+
+    for column in REQUIRED_COLUMNS:
+        if column in df:
+            report(df[column].fillna('') == '', column, f"'{column}' vazio")
+
+    if 'questão' in df:
+        ids = df['questão'].fillna('')
+        filled = ids != ''
+        well_formed = ids.str.fullmatch(QUESTION_ID.pattern)
+        report(filled & ~well_formed, 'questão', "questão inválida {value!r}")
+        if questions is not None:
+            unknown = well_formed & ~ids.isin(list(questions))
+            report(unknown, 'questão', "questão {value!r} não existe no checklist")
+        report(filled & ids.duplicated(), 'questão', "questão {value!r} repetida")
+
+    for column, allowed in FIXED_LABELS.items():
+        if column in df:
+            values = df[column].fillna('')
+            report((values != '') & ~values.isin(allowed), column,
+                   f"{column} {{value!r}} não é um de: {', '.join(allowed)}")
+
+    return [message for _, message in sorted(errors, key=lambda e: e[0])][:max_errors]
@@ -0,0 +1,131 @@
+"""Pontuação ponderada de conformidade, no estilo do IG-SEST
+
+Cada questão pesa ``peso da prioridade × peso da fonte``; a pontuação é a
+soma dos pesos das questões conformes sobre a soma dos pesos de todas. Os
+pesos viram um vetor sobre as linhas do cubo de contagens, então cada
+pontuação é um produto escalar e trocar os pesos recalcula a rede toda de
+uma vez.
+
+A fonte é texto livre e muitas vezes combina referências ("IG-Sest e Lei nº
+13.303/2016"); ela é classificada nas categorias de ``FONTES`` e recebe o
+maior peso entre as categorias que cita.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Pesos padrão, ajustáveis no painel
+PESOS_PRIORIDADE = {'Alta': 3.0, 'Média': 2.0, 'Baixa': 1.0}
+PESOS_FONTE = {'Legislação': 3.0, 'IG-SEST': 2.0, 'IESGO-TCU': 2.0, 'Boas práticas': 1.0}
+
+# Peso de valores fora das listas acima (ex.: fonte sem categoria conhecida)
+PESO_PADRAO = 1.0
+
+FONTES = {
+    'Legislação': re.compile(r'\b(Lei|Decreto|Resolução|Portaria)\b'),
+    'IG-SEST': re.compile(r'IG-Sest', re.IGNORECASE),
+    'IESGO-TCU': re.compile(r'IESGO'),
+    'Boas práticas': re.compile(r'Boas práticas', re.IGNORECASE),
+}
+
+
+def fonte_categories(fonte):
+    """Categorias de ``FONTES`` citadas na fonte de uma questão"""
+    return [category for category, pattern in FONTES.items() if pattern.search(str(fonte))]
+
+
+class WeightProfile:
+    """Pesos por prioridade e por categoria de fonte
+
+    Pesos omitidos ficam com os valores padrão. ``key`` identifica o perfil
+    nos caches.
+    """
+
+    def __init__(self, prioridade=None, fonte=None):
+        self.prioridade = {**PESOS_PRIORIDADE, **(prioridade or {})}
+        self.fonte = {**PESOS_FONTE, **(fonte or {})}
+        self.key = (tuple(sorted(self.prioridade.items())), tuple(sorted(self.fonte.items())))
+
+    def prioridade_weights(self, labels):
+        return np.array([self.prioridade.get(label, PESO_PADRAO) for label in labels], dtype=float)
+
+    def fonte_weights(self, labels):
+        return np.array([
+            max((self.fonte[c] for c in fonte_categories(label)), default=PESO_PADRAO)
+            for label in labels
+        ], dtype=float)
+
+
+class WeightedScores:
+    """Pontuação ponderada sobre o cubo de uma versão dos dados
+
+    As chaves do cubo são codificadas uma vez; por perfil de pesos só se
+    monta o vetor de pesos das linhas, guardado nos ``max_profiles`` perfis
+    mais recentes junto com as pontuações por hospital já calculadas.
+    """
+
+    def __init__(self, cube, max_profiles=16):
+        counts = cube.counts
+        self.max_profiles = max_profiles
+        self.codes = {}
+        self.labels = {}
+        for column in ('hospital', 'ciclo', 'prioridade', 'fonte'):
+            codes, labels = pd.factorize(counts[column], sort=True)
+            self.codes[column] = codes
+            self.labels[column] = list(labels)
+        self.n = counts['n'].to_numpy(dtype=float)
+        self.conformes = np.where(counts['status'].to_numpy() == 'Conforme', self.n, 0.0)
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _profile(self, profile):
+        """Pesos das linhas do cubo e pontuações já calculadas do perfil"""
+        with self._lock:
+            if profile.key in self._profiles:
+                self._profiles.move_to_end(profile.key)
+                return self._profiles[profile.key]
+
+        weights = (
+            profile.prioridade_weights(self.labels['prioridade'])[self.codes['prioridade']]
+            * profile.fonte_weights(self.labels['fonte'])[self.codes['fonte']]
+        )
+        value = (weights, {})
+        with self._lock:
+            value = self._profiles.setdefault(profile.key, value)
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+        return value
+
+    def _mask(self, hospitais, ciclos):
+        mask = np.ones(len(self.n), dtype=bool)
+        for column, chosen in (('hospital', hospitais), ('ciclo', ciclos)):
+            if chosen is not None:
+                chosen = set(chosen)
+                wanted = [i for i, label in enumerate(self.labels[column]) if label in chosen]
+                mask &= np.isin(self.codes[column], wanted)
+        return mask
+
+    def score(self, profile, hospitais=None, ciclos=None):
+        """Pontuação (%) dos hospitais e ciclos escolhidos, ou ``NaN`` sem questões"""
+        weights, _ = self._profile(profile)
+        mask = self._mask(hospitais, ciclos)
+        total = np.dot(weights[mask], self.n[mask])
+        return np.dot(weights[mask], self.conformes[mask]) / total * 100 if total else float('nan')
+
+    def by_hospital(self, profile, ciclo):
+        """Pontuação (%) de cada hospital da rede no ciclo"""
+        weights, results = self._profile(profile)
+        if ciclo not in results:
+            mask = self._mask(None, [ciclo])
+            hospitals = self.codes['hospital'][mask]
+            size = len(self.labels['hospital'])
+            total = np.bincount(hospitals, weights=(weights * self.n)[mask], minlength=size)
+            conformes = np.bincount(hospitals, weights=(weights * self.conformes)[mask], minlength=size)
+            scores = pd.Series(conformes, index=self.labels['hospital']) / total * 100
+            results[ciclo] = scores[total > 0]
+        return results[ciclo]
+
@@ -0,0 +1,175 @@
+"""Dados publicados em disco e mapeados em memória por todos os processos
+
+Cada versão dos dados vira um diretório imutável com um ``.npy`` por coluna
+de códigos e as tabelas de rótulos em JSON. O cubo de contagens publicado é
+o que o armazém mantém a cada gravação, quando ele conta exatamente a versão
+publicada; se não, é contado dos mesmos códigos. Fica gravado também como
+``.npy`` de códigos por grupo. Sessões e processos
+mapeiam esses arquivos somente para leitura, então o sistema operacional
+mantém uma única cópia em memória, não importa quantos leitores.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from igsest.compact import CompactChecklist, code_dtype
+from igsest.cube import CUBE_KEYS, MetricsCube, count_codes
+
+SHARED_DIR = '_compartilhado'
+META_FILE = 'rotulos.json'
+
+
+def cube_codes(compact, cube=None):
+    """Códigos de cada chave por grupo e contagens, nos rótulos de ``compact``
+
+    Traduz as contagens de ``cube`` quando dado; sem ele, ou se ele cita um
+    valor que não está nos dados, conta direto dos códigos.
+    """
+    if cube is not None:
+        counts = cube.counts
+        group_codes = {
+            key: pd.Categorical(counts[key].astype(object), categories=compact.labels[key]).codes
+            for key in CUBE_KEYS
+        }
+        if all((codes >= 0).all() for codes in group_codes.values()):
+            return (
+                {key: codes.astype(code_dtype(len(compact.labels[key]))) for key, codes in group_codes.items()},
+                counts['n'].to_numpy(np.int64)
+            )
+    return count_codes(compact.codes, compact.labels)
+
+
+class SharedData:
+    """Versões publicadas dos dados, uma por diretório
+
+    A publicação escreve tudo num diretório temporário e o renomeia para o
+    nome da versão, que é o hash de conteúdo do armazém; quem quer a versão
+    atual pergunta ao armazém, não a este diretório. Só as ``keep`` versões
+    mais recentes ficam em disco. Leitores de versões antigas continuam com seus mapas válidos mesmo após
+    a remoção dos arquivos.
+    """
+
+    def __init__(self, root, keep=2):
+        self.root = root
+        self.keep = keep
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, versao):
+        return os.path.join(self.root, str(versao))
+
+    def exists(self, versao):
+        return os.path.exists(os.path.join(self._path(versao), META_FILE))
+
+    def publish(self, versao, compact, cube=None):
+        """Grava uma versão, se ainda não publicada, e remove as mais antigas
+
+        ``cube`` é o cubo mantido pelo armazém para ``versao``; sem ele as
+        contagens são calculadas de ``compact``.
+        """
+        with self._lock:
+            if not self.exists(versao):
+                if os.path.exists(self._path(versao)):
+                    shutil.rmtree(self._path(versao), ignore_errors=True)
+                tmp_dir = tempfile.mkdtemp(dir=self.root, prefix='.tmp-')
+                try:
+                    self._write(tmp_dir, compact, cube)
+                    os.rename(tmp_dir, self._path(versao))
+                except OSError:
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+                    # Outro processo publicou a mesma versão antes
+                    if not self.exists(versao):
+                        raise
+            self._prune(versao)
+
+    def _write(self, directory, compact, cube=None):
+        meta = {'columns': compact.columns, 'codes': {}, 'labels': compact.labels, 'cube': {}}
+        for i, (column, values) in enumerate(compact.codes.items()):
+            name = f"{i:02d}.npy"
+            np.save(os.path.join(directory, name), np.ascontiguousarray(values))
+            meta['codes'][column] = name
+        if compact.descriptions is not None:
+            per_question, texts = compact.descriptions
+            np.save(os.path.join(directory, 'descricoes.npy'), per_question)
+            meta['descriptions'] = texts
+
+        # Cubo: códigos de cada chave por grupo, nos rótulos das colunas
+        group_codes, n = cube_codes(compact, cube)
+        for i, key in enumerate(CUBE_KEYS):
+            name = f"cubo_{i:02d}.npy"
+            np.save(os.path.join(directory, name), group_codes[key])
+            meta['cube'][key] = name
+        np.save(os.path.join(directory, 'cubo_n.npy'), n)
+        meta['cube']['n'] = 'cubo_n.npy'
+
+        with open(os.path.join(directory, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    def _prune(self, versao):
+        versions = [
+            entry for entry in os.scandir(self.root)
+            if entry.is_dir() and not entry.name.startswith('.') and entry.name != str(versao)
+        ]
+        versions.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in versions[self.keep - 1:]:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+    def open(self, versao):
+        """Dados e cubo da versão, mapeados somente para leitura"""
+        directory = self._path(versao)
+        with open(os.path.join(directory, META_FILE), encoding='utf-8') as f:
+            meta = json.load(f)
+        codes = {
+            column: np.load(os.path.join(directory, name), mmap_mode='r')
+            for column, name in meta['codes'].items()
+        }
+        descriptions = None
+        if 'descriptions' in meta:
+            descriptions = (
+                np.load(os.path.join(directory, 'descricoes.npy'), mmap_mode='r'),
+                meta['descriptions']
+            )
+        compact = CompactChecklist(codes, meta['labels'], descriptions, meta['columns'])
+
+        cube_files = {
+            key: np.load(os.path.join(directory, name), mmap_mode='r')
+            for key, name in meta['cube'].items()
+        }
+        cube = MetricsCube.from_codes(cube_files, meta['labels'], cube_files.pop('n'))
+        return compact, cube
+
+
+def open_shared(store, versao=None):
+    """Mapeia os dados publicados do armazém, publicando-os se faltarem
+
+    Devolve ``(versao, dados, cubo)``. Se ``versao`` não está publicada,
+    publica e abre a versão atual do armazém, que pode ser mais nova que a
+    pedida; a versão devolvida é sempre a aberta.
+    """
+    shared = SharedData(os.path.join(store.root, SHARED_DIR))
+    if versao is None or not shared.exists(versao):
+        # Espera a carga em lote em andamento: a versão publicada tem o lote inteiro
+        while store.is_loading():
+            time.sleep(0.1)
+        versao = store.version()
+        if not shared.exists(versao):
+            # Relê se uma partição mudou durante a leitura ou se uma carga
+            # começou nesse meio-tempo: o nome da versão precisa corresponder
+            # ao conteúdo publicado
+            while True:
+                compact = store.read_compact()
+                lida, versao = versao, store.version()
+                if store.is_loading():
+                    time.sleep(0.1)
+                elif lida == versao:
+                    break
+            shared.publish(versao, compact, store.saved_cube(versao))
+    compact, cube = shared.open(versao)
+    return versao, compact, cube
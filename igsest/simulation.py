@@ -0,0 +1,119 @@
+"""Simulação de planos de correção: questões não conformes dadas como resolvidas
+
+As contagens da seleção são reduzidas uma vez a dimensão × prioridade ×
+status, e cada questão não conforme vira um delta sobre essas poucas linhas.
+Marcar ou desmarcar uma questão só soma ou subtrai o delta dela; métricas e
+gráficos saem das contagens simuladas, sem voltar às linhas do checklist.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from igsest.cube import MetricsCube
+from igsest.metrics import PADRAO_EBSERH
+from igsest.schema import PRIORIDADES, STATUS
+
+SIMULATION_KEYS = ['dimensão', 'prioridade', 'status']
+
+CONFORME = STATUS.index('Conforme')
+NAO_CONFORME = STATUS.index('Não Conforme')
+
+
+class RemediationPlan:
+    """Questões resolvidas no plano e as contagens projetadas da seleção
+
+    ``cube`` é o cubo da seleção (hospitais e ciclos); ``df`` são as linhas
+    dela, usadas só para saber onde cada questão está não conforme.
+    """
+
+    def __init__(self, cube, df):
+        base = cube.totals(SIMULATION_KEYS)
+        self.dimensions = sorted(base.index.get_level_values('dimensão').unique())
+        grid = pd.MultiIndex.from_product([self.dimensions, PRIORIDADES, STATUS], names=SIMULATION_KEYS)
+        self.grid = grid.to_frame(index=False)
+        self.base = base.reindex(grid, fill_value=0).to_numpy(dtype=np.int64)
+        self.counts = self.base.copy()
+        self.resolved = set()
+
+        # Linha da grade de cada (dimensão, prioridade, status)
+        shape = (len(self.dimensions), len(PRIORIDADES), len(STATUS))
+        bad = df[df['status'] == 'Não Conforme']
+        per_question = bad.groupby(['questão', 'dimensão', 'prioridade'], observed=True).size()
+        per_question = per_question[per_question > 0].reset_index(name='n')
+        dims = pd.Index(self.dimensions).get_indexer(per_question['dimensão'].astype(object))
+        prios = pd.Index(PRIORIDADES).get_indexer(per_question['prioridade'].astype(object))
+        rows = np.ravel_multi_index((dims, prios, np.full(len(dims), NAO_CONFORME)), shape)
+
+        self.deltas = {}
+        self.priorities = {}
+        for question, prio, row, n in zip(per_question['questão'].astype(str), prios, rows, per_question['n']):
+            self.deltas.setdefault(question, []).append((row, row - NAO_CONFORME + CONFORME, int(n)))
+            self.priorities[question] = min(self.priorities.get(question, prio), prio)
+        first = bad.drop_duplicates('questão')
+        self.descriptions = dict(zip(first['questão'].astype(str), first['descrição'].astype(str)))
+
+        self.total = int(self.base.sum())
+        self.conformes = int(self.base[CONFORME::len(STATUS)].sum())
+
+    def candidates(self):
+        """Questões não conformes na seleção, as de prioridade mais alta primeiro"""
+        return sorted(self.deltas, key=lambda q: self.priorities[q])
+
+    def priority(self, question):
+        return PRIORIDADES[self.priorities[question]]
+
+    def _apply(self, question, sign):
+        for bad_row, good_row, n in self.deltas[question]:
+            self.counts[bad_row] -= sign * n
+            self.counts[good_row] += sign * n
+            self.conformes += sign * n
+
+    def toggle(self, question, resolved=True):
+        """Marca (ou desmarca) a questão como resolvida; custo do tamanho do delta"""
+        if question not in self.deltas or (question in self.resolved) == resolved:
+            return
+        self._apply(question, 1 if resolved else -1)
+        if resolved:
+            self.resolved.add(question)
+        else:
+            self.resolved.discard(question)
+
+    def set_resolved(self, questions):
+        """Ajusta o plano às questões dadas, aplicando só o que mudou"""
+        questions = set(questions)
+        for question in self.resolved - questions:
+            self.toggle(question, False)
+        for question in questions - self.resolved:
+            self.toggle(question, True)
+
+    @property
+    def rate(self):
+        return self.conformes / self.total * 100 if self.total else float('nan')
+
+    def needed(self, padrao=PADRAO_EBSERH):
+        """Avaliações não conformes que ainda faltam corrigir para atingir ``padrao``"""
+        return max(0, math.ceil(padrao / 100 * self.total - self.conformes - 1e-9))
+
+    def cube(self):
+        """Contagens projetadas, aceitas pelos gráficos e por ``calculate_metrics``"""
+        counts = self.grid.assign(n=self.counts)
+        return MetricsCube(counts[counts['n'] > 0].reset_index(drop=True))
+
+    def metrics(self):
+        """Métricas projetadas no formato de ``calculate_metrics``"""
+        per_dimension = self.counts.reshape(len(self.dimensions), -1, len(STATUS)).sum(axis=1)
+        dim_metrics = pd.DataFrame(
+            {'total': per_dimension.sum(axis=1), 'conformes': per_dimension[:, CONFORME]},
+            index=pd.Index(self.dimensions, name='dimensão')
+        )
+        dim_metrics = dim_metrics[dim_metrics['total'] > 0]
+        dim_metrics['taxa'] = (dim_metrics['conformes'] / dim_metrics['total'] * 100).round(1)
+        return {
+            'total': self.total,
+            'conformes': self.conformes,
+            'nao_conformes': self.total - self.conformes,
+            'taxa_conformidade': self.rate,
+            'dimensoes': dim_metrics,
+        }
@@ -0,0 +1,181 @@
+"""Visão padrão do painel, pré-calculada uma vez por versão dos dados
+
+Quem abre o painel sem mexer nos filtros vê sempre a mesma página: o
+hospital padrão no ciclo mais recente, com todas as dimensões, status e
+prioridades. Essas métricas e figuras (em JSON) são montadas uma vez por
+versão e gravadas junto aos dados publicados; as sessões só as leem.
+
+Uso:
+
+    python -m igsest.snapshot [--armazem DIR]
+"""
+
+import argparse
+import json
+import os
+import sys
+from functools import cached_property
+
+import pandas as pd
+
+from igsest.atomic import replacing
+from igsest.charts import create_overview_charts, create_priority_chart, create_trend_chart
+from igsest.metrics import PADRAO_EBSERH, calculate_metrics
+from igsest.shared import SHARED_DIR
+from igsest.store import DEFAULT_ROOT, HOSPITAL_PADRAO, open_store
+from igsest.trends import TREND_SERIES, cycle_rates, trend_table
+
+SNAPSHOT_FILE = 'visao_padrao.json'
+SNAPSHOT_KEY = 'visao_padrao'
+
+# Colunas filtráveis na barra lateral, todas marcadas na visão padrão
+FILTER_COLUMNS = ('dimensão', 'status', 'prioridade')
+
+
+def default_view(data):
+    """Hospitais e ciclos marcados quando a página abre, nos dados de ``data``"""
+    hospitais = data.hospitals()
+    hospitais = [HOSPITAL_PADRAO] if HOSPITAL_PADRAO in hospitais else hospitais[:1]
+    return hospitais, data.cycles(hospitais)[-1:]
+
+
+def trend_figure(cube, por, titulo, hospitais=None, **filters):
+    """Gráfico de evolução de uma série; só a rede ignora ``hospitais``"""
+    cube = cube.select(hospital=None if por is None else hospitais, **filters)
+    return create_trend_chart(trend_table(cycle_rates(cube, por)), titulo, reference=PADRAO_EBSERH)
+
+
+def _figure_json(fig):
+    """Figura em JSON sem o tema, que é aplicado por quem a lê"""
+    spec = json.loads(fig.to_json())
+    spec['layout'].pop('template', None)
+    return spec
+
+
+def build_snapshot(data, hospitais, ciclos):
+    """Conteúdo da visão padrão de ``data`` (um ``VersionData``)"""
+    _, index = data.selection(hospitais, ciclos)
+    filters = {
+        'hospital': list(hospitais),
+        'ciclo': list(ciclos),
+        **{column: index.options(column) for column in FILTER_COLUMNS},
+    }
+    cube = data.cube.select(**filters)
+    metrics = calculate_metrics(cube)
+    pie, bar = create_overview_charts(cube)
+
+    figures = {
+        'visao_geral': [_figure_json(pie), _figure_json(bar)],
+        'prioridades': _figure_json(create_priority_chart(cube)),
+    }
+    for por, _, titulo in TREND_SERIES:
+        figures[f"tendencia_{por}"] = _figure_json(trend_figure(
+            data.cube, por, titulo, hospitais,
+            dimensão=filters['dimensão'], prioridade=filters['prioridade']
+        ))
+
+    return {
+        'versao': data.versao,
+        'filtros': filters,
+        'metricas': {
+            **{k: v for k, v in metrics.items() if k != 'dimensoes'},
+            'dimensoes': json.loads(metrics['dimensoes'].to_json(orient='split')),
+        },
+        'figuras': figures,
+    }
+
+
+class ViewSnapshot:
+    """Visão padrão lida do disco, com as figuras remontadas sob demanda
+
+    As figuras são compartilhadas entre sessões e não devem ser alteradas.
+    """
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.versao = payload['versao']
+        self.filters = payload['filtros']
+        self._figures = {}
+
+    def matches(self, **filters):
+        """Se os filtros dados são os mesmos da visão padrão"""
+        return all(
+            sorted(str(v) for v in (values or [])) == sorted(self.filters[column])
+            for column, values in filters.items()
+        )
+
+    @cached_property
+    def metrics(self):
+        """Métricas no formato de ``calculate_metrics``"""
+        metrics = dict(self.payload['metricas'])
+        metrics['dimensoes'] = pd.DataFrame(**metrics['dimensoes']).rename_axis('dimensão')
+        return metrics
+
+    def figure(self, name):
+        """Figura (ou tupla de figuras) gravada com o nome ``name``"""
+        import plotly.graph_objects as go
+
+        if name not in self._figures:
+            spec = self.payload['figuras'][name]
+            self._figures[name] = tuple(map(go.Figure, spec)) if isinstance(spec, list) else go.Figure(spec)
+        return self._figures[name]
+
+    @classmethod
+    def read(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def write(self, path):
+        with replacing(path) as tmp_path:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.payload, f, ensure_ascii=False)
+
+
+def snapshot_path(store, versao):
+    return os.path.join(store.root, SHARED_DIR, str(versao), SNAPSHOT_FILE)
+
+
+def load_snapshot(store, data):
+    """Visão padrão da versão, lida do disco ou montada e gravada agora
+
+    Devolve ``None`` se o armazém não tem dados para a visão padrão.
+    """
+    path = snapshot_path(store, data.versao)
+    if os.path.exists(path):
+        return ViewSnapshot.read(path)
+
+    hospitais, ciclos = default_view(data)
+    if not hospitais or not ciclos or not len(data.selection(hospitais, ciclos)[0]):
+        return None
+    snapshot = ViewSnapshot(build_snapshot(data, hospitais, ciclos))
+    try:
+        snapshot.write(path)
+    except OSError:
+        # Versão removida por uma publicação mais nova; serve da memória
+        pass
+    return snapshot
+
+
+def view_snapshot(store, data):
+    """Visão padrão da versão, carregada uma só vez por processo"""
+    return data.cached(SNAPSHOT_KEY, lambda: load_snapshot(store, data))
+
+
+def main(argv=None):
+    from igsest.versions import VersionData
+
+    parser = argparse.ArgumentParser(description="Pré-calcula a visão padrão do painel IG-SEST")
+    parser.add_argument('--armazem', default=DEFAULT_ROOT, help="raiz do armazém (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+
+    store = open_store(args.armazem)
+    data = VersionData.open(store, store.version())
+    if load_snapshot(store, data) is None:
+        print("Armazém sem dados para a visão padrão", file=sys.stderr)
+        return 1
+    print(f"Visão padrão da versão {data.versao} em {snapshot_path(store, data.versao)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
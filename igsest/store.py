@@ -0,0 +1,237 @@
+"""Armazenamento de conformidades particionado por hospital e ciclo de avaliação"""
+
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+from igsest.atomic import replacing, staging_path
+from igsest.compact import CompactChecklist
+from igsest.cube import CUBE_KEYS, PARTITION_KEYS, MetricsCube, count_rows
+from igsest.datasource import BUNDLED_CHECKLIST, read_checklist
+from igsest.schema import COLUMNS
+
+DEFAULT_ROOT = os.environ.get(
+    'IGSEST_STORE',
+    os.path.join(os.path.dirname(BUNDLED_CHECKLIST), 'armazem')
+)
+
+# Partição criada a partir do checklist embarcado quando o armazém está vazio
+HOSPITAL_PADRAO = 'MEJC-UFRN'
+CICLO_PADRAO = '2025'
+
+PARTITION_FILE = 'dados.parquet'
+CUBE_FILE = '_cubo.parquet'
+# Marca de carga em lote; marcas mais velhas que isso são de cargas interrompidas
+LOAD_FILE = '_carga'
+LOAD_TIMEOUT = 60
+
+
+def _check_key(name, value):
+    value = str(value)
+    if not value or value.startswith('.') or '/' in value or os.sep in value or '=' in value:
+        raise ValueError(f"Identificador de {name} inválido: {value!r}")
+    return value
+
+
+class ComplianceStore:
+    """Conformidades em disco, uma partição Parquet por (hospital, ciclo)
+
+    Layout: ``<raiz>/hospital=<id>/ciclo=<id>/dados.parquet``. As leituras
+    abrem apenas as partições pedidas.
+    """
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = root
+        # Hash de conteúdo por partição, indexado pelo (mtime, tamanho) do arquivo
+        self._digests = {}
+
+    def _partition_path(self, hospital, ciclo):
+        return os.path.join(
+            self.root,
+            f"hospital={_check_key('hospital', hospital)}",
+            f"ciclo={_check_key('ciclo', ciclo)}",
+            PARTITION_FILE
+        )
+
+    def partitions(self):
+        """Lista os pares (hospital, ciclo) presentes no armazém"""
+        found = []
+        if not os.path.isdir(self.root):
+            return found
+        for h_dir in os.scandir(self.root):
+            if not (h_dir.is_dir() and h_dir.name.startswith('hospital=')):
+                continue
+            for c_dir in os.scandir(h_dir.path):
+                if c_dir.name.startswith('ciclo=') and os.path.exists(os.path.join(c_dir.path, PARTITION_FILE)):
+                    found.append((h_dir.name.split('=', 1)[1], c_dir.name.split('=', 1)[1]))
+        return sorted(found)
+
+    def hospitals(self):
+        return sorted({h for h, _ in self.partitions()})
+
+    def cycles(self, hospitals=None):
+        return sorted({c for h, c in self.partitions() if hospitals is None or h in hospitals})
+
+    def _content_digest(self, path):
+        """Hash do conteúdo da partição, recalculado só quando o arquivo muda"""
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._digests.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        self._digests[path] = (stamp, digest.hexdigest())
+        return digest.hexdigest()
+
+    def version(self):
+        """Hash do conteúdo de todas as partições
+
+        Regravar uma partição com o mesmo conteúdo não muda a versão.
+        """
+        digest = hashlib.sha1()
+        for hospital, ciclo in self.partitions():
+            content = self._content_digest(self._partition_path(hospital, ciclo))
+            digest.update(f"{hospital}/{ciclo}:{content};".encode())
+        return digest.hexdigest()[:12]
+
+    @contextmanager
+    def loading(self):
+        """Marca o armazém como em carga enquanto um lote de partições entra"""
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, LOAD_FILE)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(str(os.getpid()))
+        try:
+            yield
+        finally:
+            os.remove(path)
+
+    def is_loading(self):
+        """Se há uma carga em lote entrando no armazém agora"""
+        try:
+            return time.time() - os.stat(os.path.join(self.root, LOAD_FILE)).st_mtime < LOAD_TIMEOUT
+        except FileNotFoundError:
+            return False
+
+    def _stage_partition(self, df, hospital, ciclo):
+        """Grava a partição num temporário ao lado do destino, ainda invisível
+
+        Leitores só a veem depois de ``_commit_partition``.
+        """
+        path = self._partition_path(hospital, ciclo)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = staging_path(path)
+        try:
+            df[COLUMNS].to_parquet(tmp_path, index=False)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return tmp_path
+
+    def _commit_partition(self, tmp_path, hospital, ciclo):
+        os.replace(tmp_path, self._partition_path(hospital, ciclo))
+
+    def _write_partition(self, df, hospital, ciclo):
+        path = self._partition_path(hospital, ciclo)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Escreve em arquivo temporário e troca de uma vez, para que
+        # leitores concorrentes nunca vejam uma partição pela metade
+        with replacing(path) as tmp_path:
+            df[COLUMNS].to_parquet(tmp_path, index=False)
+
+    def write(self, df, hospital, ciclo):
+        """Grava (ou substitui) a partição de um hospital em um ciclo"""
+        self.write_partitions({(hospital, ciclo): df})
+
+    def write_partitions(self, partitions):
+        """Grava (ou substitui) várias partições ``{(hospital, ciclo): df}``
+
+        O cubo é lido e gravado uma vez só para o lote inteiro.
+        """
+        cube = self.cube()
+        counts = {}
+        for (hospital, ciclo), df in partitions.items():
+            self._write_partition(df, hospital, ciclo)
+            counts[(hospital, ciclo)] = count_rows(df.assign(hospital=hospital, ciclo=ciclo))
+        cube.replace_many_counts(counts)
+        self._save_cube(cube)
+
+    def append(self, df, hospital, ciclo):
+        """Acrescenta linhas a uma partição, somando só elas ao cubo"""
+        cube = self.cube()
+        rows = df
+        if (hospital, ciclo) in self.partitions():
+            current = read_checklist(self._partition_path(hospital, ciclo))
+            rows = pd.concat([current, df[COLUMNS]], ignore_index=True)
+        self._write_partition(rows, hospital, ciclo)
+        cube.add(df.assign(hospital=hospital, ciclo=ciclo))
+        self._save_cube(cube)
+
+    def _save_cube(self, cube):
+        """Grava o cubo marcado com a versão atual das partições"""
+        cube.save(os.path.join(self.root, CUBE_FILE), self.version())
+
+    def saved_cube(self, versao):
+        """Cubo mantido pelas gravações, se ele conta exatamente ``versao``
+
+        Se o processo parou entre gravar uma partição e o cubo, a marca do
+        cubo fica para trás e ele é ignorado.
+        """
+        path = os.path.join(self.root, CUBE_FILE)
+        if not os.path.exists(path):
+            return None
+        cube = MetricsCube.load(path)
+        return cube if cube.versao == versao else None
+
+    def cube(self):
+        """Cubo de contagens da versão atual, reconstruído se o gravado não a conta"""
+        cube = self.saved_cube(self.version())
+        if cube is None:
+            cube = MetricsCube.from_rows(self.read(columns=[k for k in CUBE_KEYS if k not in PARTITION_KEYS]))
+            if self.partitions():
+                self._save_cube(cube)
+        return cube
+
+    def read_compact(self, hospitals=None, ciclos=None, columns=None):
+        """Lê as partições selecionadas direto para a forma compacta"""
+        selected = [
+            (h, c) for h, c in self.partitions()
+            if (hospitals is None or h in hospitals) and (ciclos is None or c in ciclos)
+        ]
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # A descrição é guardada por questão, então a questão também é lida
+        columns = list(columns or COLUMNS)
+        if 'descrição' in columns and 'questão' not in columns:
+            columns.insert(0, 'questão')
+        schema = pa.schema([(c, pa.string()) for c in columns])
+        tables = [
+            pq.read_table(self._partition_path(h, c), columns=columns).cast(schema)
+            for h, c in selected
+        ]
+        table = pa.concat_tables(tables) if tables else schema.empty_table()
+        return CompactChecklist.from_arrow(
+            table, selected, [t.num_rows for t in tables], PARTITION_KEYS
+        )
+
+    def read(self, hospitals=None, ciclos=None, columns=None):
+        """Lê somente as partições dos hospitais e ciclos selecionados"""
+        compact = self.read_compact(hospitals, ciclos, columns)
+        return compact.frame(PARTITION_KEYS + list(columns or COLUMNS))
+
+
+def open_store(root=DEFAULT_ROOT):
+    """Abre o armazém, semeando-o com o checklist embarcado se estiver vazio"""
+    store = ComplianceStore(root)
+    if not store.partitions():
+        store.write(read_checklist(BUNDLED_CHECKLIST), HOSPITAL_PADRAO, CICLO_PADRAO)
+    return store
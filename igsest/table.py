@@ -0,0 +1,81 @@
+"""Estilo e paginação das tabelas do painel"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+STATUS_STYLES = {
+    'Conforme': 'background-color: #d4edda; color: #155724',
+    'Não Conforme': 'background-color: #f8d7da; color: #721c24',
+}
+
+
+def status_styles(values):
+    """CSS de cada célula da coluna de status, calculado de uma vez
+
+    Em colunas categóricas o mapeamento é feito por categoria, não por linha.
+    """
+    styles = values.map(STATUS_STYLES).astype(object)
+    return styles.where(styles.notna(), '')
+
+
+def style_status(df, column='Status'):
+    """Styler com a coluna de status colorida por uma única chamada vetorizada"""
+    return df.style.apply(status_styles, subset=[column])
+
+
+def page_count(total_rows, page_size):
+    return max(1, math.ceil(total_rows / page_size))
+
+
+def _contains(values, text):
+    """Linhas cujo valor contém ``text``, sem diferenciar maiúsculas
+
+    Em colunas categóricas a busca percorre só as categorias e depois
+    compara os códigos.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories.to_series().astype(str)
+        matching = np.flatnonzero(categories.str.contains(text, case=False, regex=False).to_numpy(dtype=bool))
+        return np.isin(values.cat.codes.to_numpy(), matching)
+    return values.astype(str).str.contains(text, case=False, regex=False).to_numpy(dtype=bool)
+
+
+class TableCursor:
+    """Posições das linhas de ``df`` após busca e ordenação
+
+    A busca e a ordenação são feitas uma vez, sobre arrays; cada página é
+    só uma fatia das posições seguida de ``iloc``. O cursor guarda apenas as
+    posições, então vale para qualquer cópia do mesmo ``df``.
+    """
+
+    def __init__(self, df, sort_by=None, ascending=True, search=None, search_columns=()):
+        positions = np.arange(len(df))
+
+        if search:
+            found = np.zeros(len(df), dtype=bool)
+            for column in search_columns:
+                found |= _contains(df[column], search)
+            positions = np.flatnonzero(found)
+
+        if sort_by is not None:
+            values = df[sort_by]
+            # Categorias ordenam pela ordem declarada (ex.: Alta, Média, Baixa)
+            keys = values.cat.codes.to_numpy() if isinstance(values.dtype, pd.CategoricalDtype) else values.to_numpy(dtype=object)
+            order = np.argsort(keys[positions], kind='stable')
+            positions = positions[order if ascending else order[::-1]]
+
+        self.positions = positions
+
+    def __len__(self):
+        return len(self.positions)
+
+    def page_count(self, page_size):
+        return page_count(len(self), page_size)
+
+    def page(self, df, page, page_size):
+        """Linhas de ``df`` na página ``page`` (a partir de 1)"""
+        page = min(max(int(page), 1), self.page_count(page_size))
+        start = (page - 1) * page_size
+        return df.iloc[self.positions[start:start + page_size]]
@@ -0,0 +1,77 @@
+"""Evolução da taxa de conformidade entre ciclos de avaliação
+
+As séries saem do cubo de contagens com um único agrupamento; médias
+móveis e variações são calculadas de uma vez sobre a matriz séries × ciclos.
+"""
+
+import numpy as np
+import pandas as pd
+
+from igsest.schema import FIXED_LABELS
+
+# Ciclos considerados na média móvel
+TREND_WINDOW = 3
+
+# Séries mostradas no painel: (coluna agrupada, aba, título do gráfico)
+TREND_SERIES = [
+    (None, "Rede", "Taxa de Conformidade da Rede"),
+    ('hospital', "Por hospital", "Taxa de Conformidade por Hospital"),
+    ('dimensão', "Por dimensão", "Taxa de Conformidade por Dimensão"),
+    ('prioridade', "Por prioridade", "Taxa de Conformidade por Prioridade"),
+]
+
+
+def cycle_rates(cube, by=None):
+    """Taxa de conformidade (%) de cada série em cada ciclo
+
+    Devolve uma matriz com uma linha por valor de ``by`` (ou uma linha
+    ``'Rede'`` se ``by`` é ``None``) e uma coluna por ciclo. Ciclos sem
+    questões avaliadas na série ficam ``NaN``.
+    """
+    keys = ['ciclo', 'status'] if by is None else [by, 'ciclo', 'status']
+    counts = cube.totals(keys).unstack('status', fill_value=0)
+    total = counts.sum(axis=1)
+    conformes = counts['Conforme'] if 'Conforme' in counts else total * 0
+    rates = (conformes / total * 100).where(total > 0)
+
+    if by is None:
+        return rates.to_frame('Rede').T
+    rates = rates.unstack('ciclo').sort_index(axis=1)
+    if by in FIXED_LABELS:
+        rates = rates.reindex([v for v in FIXED_LABELS[by] if v in rates.index])
+    return rates
+
+
+def trend_table(rates, window=TREND_WINDOW):
+    """Séries em formato longo com média móvel e variação entre ciclos
+
+    A variação compara cada ciclo com o anterior da mesma série; a média
+    móvel usa os últimos ``window`` ciclos com dados da série, pulando os
+    ciclos em que ela não foi avaliada.
+    """
+    values = rates.to_numpy(dtype=float)
+    delta = np.full_like(values, np.nan)
+    delta[:, 1:] = values[:, 1:] - values[:, :-1]
+
+    # Somas acumuladas só dos ciclos com dados: sums[i, k] é a soma dos k
+    # primeiros valores observados da série i
+    observed = ~np.isnan(values)
+    order = np.cumsum(observed, axis=1)
+    rows = np.arange(len(values))[:, None]
+    sums = np.zeros((len(values), values.shape[1] + 1))
+    sums[rows.repeat(values.shape[1], axis=1)[observed], order[observed]] = (
+        np.cumsum(np.where(observed, values, 0), axis=1)[observed]
+    )
+    start = np.maximum(order - window, 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rolling = (sums[rows, order] - sums[rows, start]) / (order - start)
+    rolling[~observed] = np.nan
+
+    n_series, n_cycles = values.shape
+    return pd.DataFrame({
+        'serie': np.repeat(rates.index.astype(str), n_cycles),
+        'ciclo': np.tile(rates.columns.astype(str), n_series),
+        'taxa': values.ravel(),
+        'media_movel': rolling.ravel(),
+        'variacao': delta.ravel(),
+    }).dropna(subset=['taxa']).reset_index(drop=True)
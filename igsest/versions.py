@@ -0,0 +1,186 @@
+"""Versão dos dados em uso e a troca para versões novas"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import cached_property
+
+import numpy as np
+
+from igsest.filters import FilterIndex
+from igsest.shared import open_shared
+
+
+class VersionData:
+    """Dados mapeados de uma versão e os derivados calculados sobre eles
+
+    Seleções e índices de filtro ficam guardados aqui dentro, então
+    descartar uma versão descarta só o que foi calculado sobre ela.
+    """
+
+    def __init__(self, versao, data, cube, max_selections=64):
+        self.versao = versao
+        self.data = data
+        self.cube = cube
+        self.max_selections = max_selections
+        self.hits = 0
+        self.misses = 0
+        self._selections = OrderedDict()
+        self._derived = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, store, versao):
+        # A versão pedida pode ter saído de publicação; vale a que foi aberta
+        versao, data, cube = open_shared(store, versao)
+        return cls(versao, data, cube)
+
+    @cached_property
+    def partitions(self):
+        """Pares (hospital, ciclo) presentes nesta versão"""
+        labels = self.data.labels
+        hospitals = self.data.codes['hospital'].astype(np.int64)
+        pairs = np.unique(hospitals * len(labels['ciclo']) + self.data.codes['ciclo'])
+        return sorted(
+            (labels['hospital'][p // len(labels['ciclo'])], labels['ciclo'][p % len(labels['ciclo'])])
+            for p in pairs
+        )
+
+    def hospitals(self):
+        return sorted({h for h, _ in self.partitions})
+
+    def cycles(self, hospitais=None):
+        return sorted({c for h, c in self.partitions if hospitais is None or h in hospitais})
+
+    def selection(self, hospitais, ciclos):
+        """Linhas dos hospitais e ciclos escolhidos e o índice de filtros delas
+
+        O DataFrame é montado uma vez por seleção e compartilhado entre
+        sessões; não deve ser alterado.
+        """
+        key = (tuple(sorted(hospitais)), tuple(sorted(ciclos)))
+        with self._lock:
+            if key in self._selections:
+                self.hits += 1
+                self._selections.move_to_end(key)
+                return self._selections[key]
+            self.misses += 1
+
+        # Colunas categóricas montadas sobre os códigos compactos
+        df = self.data.select(hospital=key[0], ciclo=key[1]).frame()
+        value = (df, FilterIndex(df))
+
+        with self._lock:
+            self._selections[key] = value
+            while len(self._selections) > self.max_selections:
+                self._selections.popitem(last=False)
+        return value
+
+    def cached(self, key, build):
+        """Agregado derivado desta versão, montado com ``build()`` uma só vez"""
+        with self._lock:
+            if key in self._derived:
+                return self._derived[key]
+        value = build()
+        with self._lock:
+            return self._derived.setdefault(key, value)
+
+    def recent_selections(self, n=8):
+        """Seleções usadas mais recentemente, para aquecer a próxima versão"""
+        with self._lock:
+            return list(reversed(self._selections))[:n]
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._selections)}
+
+
+class DataVersions:
+    """Versão ativa dos dados, trocada só quando a nova já está pronta
+
+    ``check`` compara a versão do armazém com a ativa, no máximo a cada
+    ``interval`` segundos. Se mudou, a nova versão é publicada, mapeada e
+    aquecida numa thread, com as seleções mais usadas; até lá as sessões
+    seguem na versão ativa. Os ``on_warm`` registrados também rodam nessa
+    thread, antes da troca. Na troca, a versão antiga é descartada e os
+    ``on_switch`` registrados são avisados.
+    """
+
+    def __init__(self, store, interval=5):
+        self.store = store
+        self.interval = interval
+        self.last_error = None
+        self._active = None
+        self._warming = None
+        self._checked = 0.0
+        self._callbacks = []
+        self._warmers = []
+        self._lock = threading.Lock()
+
+    def on_switch(self, callback):
+        """Registra ``callback(nova, antiga)``, chamado após cada troca"""
+        self._callbacks.append(callback)
+
+    def on_warm(self, callback):
+        """Registra ``callback(data)``, chamado com cada versão nova antes da troca"""
+        self._warmers.append(callback)
+
+    def active(self):
+        """Versão em uso, carregada na primeira chamada"""
+        with self._lock:
+            if self._active is None:
+                self._active = VersionData.open(self.store, self.store.version())
+            return self._active
+
+    def warming(self):
+        """Versão em preparação, ou ``None``"""
+        return self._warming
+
+    def check(self, force=False):
+        """Começa a preparar a versão nova do armazém, se houver
+
+        Devolve a versão em preparação, ou ``None`` se a ativa está em dia.
+        """
+        with self._lock:
+            if self._warming is not None:
+                return self._warming
+            now = time.monotonic()
+            if not force and now - self._checked < self.interval:
+                return None
+            self._checked = now
+
+        # Durante uma carga em lote a versão do armazém ainda não está completa
+        if self.store.is_loading():
+            return None
+        versao = self.store.version()
+        with self._lock:
+            if self._warming is not None:
+                return self._warming
+            if self._active is not None and self._active.versao == versao:
+                return None
+            self._warming = versao
+        threading.Thread(target=self._warm, args=(versao,), name=f"igsest-versao-{versao}", daemon=True).start()
+        return versao
+
+    def _warm(self, versao):
+        try:
+            data = VersionData.open(self.store, versao)
+            previous = self._active
+            if previous is not None:
+                for hospitais, ciclos in previous.recent_selections():
+                    data.selection(hospitais, ciclos)
+            for warmer in self._warmers:
+                warmer(data)
+        except Exception as exc:
+            with self._lock:
+                self._warming = None
+                self.last_error = f"{type(exc).__name__}: {exc}"
+            return
+
+        with self._lock:
+            previous = self._active
+            self._active = data
+            self._warming = None
+            self.last_error = None
+        for callback in self._callbacks:
+            callback(data.versao, previous.versao if previous is not None else None)
@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from igsest.datasource import read_checklist  # noqa: E402
+from igsest.store import ComplianceStore  # noqa: E402
+
+HOSPITAIS = ['HUAB', 'HUOL', 'MEJC-UFRN']
+CICLOS = ['2024', '2025']
+
+
+def sorted_counts(counts):
+    """Contagens do cubo em ordem estável e com chaves em texto, para comparar"""
+    counts = counts.astype({c: object for c in counts.columns if c != 'n'}).astype({'n': 'int64'})
+    keys = [c for c in counts.columns if c != 'n']
+    return counts.sort_values(keys).reset_index(drop=True)
+
+
+def wait_for(condition, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "tempo esgotado"
+        time.sleep(0.05)
+
+
+@pytest.fixture(scope='session')
+def checklist():
+    return read_checklist()
+
+
+@pytest.fixture(scope='session')
+def partitions(checklist):
+    """Checklist embarcado com status sorteados por (hospital, ciclo)"""
+    rng = np.random.default_rng(0)
+    parts = {}
+    for hospital in HOSPITAIS:
+        for ciclo in CICLOS:
+            part = checklist.copy()
+            part['status'] = pd.Categorical.from_codes(
+                rng.integers(0, 2, len(part)), dtype=checklist['status'].dtype
+            )
+            parts[(hospital, ciclo)] = part
+    return parts
+
+
+@pytest.fixture
+def store(tmp_path, partitions):
+    store = ComplianceStore(str(tmp_path / 'armazem'))
+    for (hospital, ciclo), part in partitions.items():
+        store.write(part, hospital, ciclo)
+    return store
+
+
+@pytest.fixture
+def rows(store):
+    """Linhas do armazém com as chaves em texto, para comparar com agregados"""
+    return store.read().astype({'hospital': object, 'ciclo': object, 'questão': object})
@@ -0,0 +1,131 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import pytest
+
+from igsest.api import ComplianceAPI, MAX_PAGE_SIZE
+
+from conftest import CICLOS, HOSPITAIS, wait_for
+
+
+@pytest.fixture
+def api(store):
+    return ComplianceAPI(store)
+
+
+def get(api, path, query='', etag=None):
+    status, headers, body = api.respond(path, query, etag)
+    return status, headers, json.loads(body) if body else None
+
+
+def test_version(api, store):
+    status, headers, body = get(api, '/versao')
+    assert status == HTTPStatus.OK
+    assert body == {'versao': store.version(), 'hospitais': HOSPITAIS, 'ciclos': CICLOS}
+    assert headers['ETag'].startswith('"')
+
+
+def test_metrics_match_rows(api, store):
+    status, _, body = get(api, '/metricas', 'hospital=HUOL&ciclo=2025')
+    rows = store.read(['HUOL'], ['2025'])
+    conformes = int((rows['status'] == 'Conforme').sum())
+    assert status == HTTPStatus.OK
+    assert body['total'] == len(rows)
+    assert body['conformes'] == conformes
+    assert body['taxa_conformidade'] == round(conformes / len(rows) * 100, 2)
+
+
+def test_empty_selection(api):
+    status, _, body = get(api, '/metricas', 'hospital=inexistente')
+    assert status == HTTPStatus.OK
+    assert body['total'] == 0 and body['taxa_conformidade'] is None
+
+
+def test_questions_page(api, store):
+    status, _, body = get(api, '/questoes', 'status=Conforme&pagina=2&tamanho=7')
+    conformes = store.read()
+    conformes = conformes[conformes['status'] == 'Conforme']
+    assert status == HTTPStatus.OK
+    assert body['total'] == len(conformes)
+    assert len(body['questoes']) == 7
+    assert {q['status'] for q in body['questoes']} == {'Conforme'}
+    assert [q['questao'] for q in body['questoes']] == list(conformes['questão'].iloc[7:14])
+
+
+def test_etag_not_modified(api):
+    status, headers, _ = get(api, '/questoes', 'tamanho=5')
+    assert status == HTTPStatus.OK
+    status, again, body = get(api, '/questoes', 'tamanho=5', etag=headers['ETag'])
+    assert status == HTTPStatus.NOT_MODIFIED
+    assert again['ETag'] == headers['ETag'] and body is None
+
+    # Outra página, outra resposta
+    status, other, _ = get(api, '/questoes', 'tamanho=6', etag=headers['ETag'])
+    assert status == HTTPStatus.OK and other['ETag'] != headers['ETag']
+
+
+def test_etag_changes_with_version(api, store, checklist):
+    _, headers, _ = get(api, '/metricas')
+    store.write(checklist, 'HUNOVO', '2025')
+    api.versions.check(force=True)
+    wait_for(lambda: api.versions.warming() is None)
+    status, again, body = get(api, '/metricas', etag=headers['ETag'])
+    assert status == HTTPStatus.OK
+    assert again['ETag'] != headers['ETag']
+    assert body['versao'] == store.version()
+
+
+@pytest.mark.parametrize('query', [
+    'pagina=x',
+    'tamanho=0',
+    f'tamanho={MAX_PAGE_SIZE + 1}',
+    'desconhecido=1',
+])
+def test_bad_request_even_with_etag(api, query):
+    _, headers, _ = get(api, '/questoes')
+    status, _, body = get(api, '/questoes', query, etag=headers['ETag'])
+    assert status == HTTPStatus.BAD_REQUEST
+    assert 'erro' in body
+
+
+def test_unknown_route(api):
+    status, _, body = get(api, '/nada')
+    assert status == HTTPStatus.NOT_FOUND
+    assert 'erro' in body
+
+
+def request(api, raw):
+    """Resposta bruta do servidor a uma requisição HTTP"""
+    async def run():
+        server = await asyncio.start_server(api.handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(raw)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+    return asyncio.run(run())
+
+
+def test_server_head_and_method(api):
+    response = request(api, b'HEAD /versao HTTP/1.1\r\nConnection: close\r\n\r\n')
+    head, _, body = response.partition(b'\r\n\r\n')
+    assert head.startswith(b'HTTP/1.1 200 OK')
+    assert body == b''
+
+    response = request(api, b'POST /versao HTTP/1.1\r\nConnection: close\r\n\r\n')
+    assert response.startswith(b'HTTP/1.1 405')
+
+
+def test_server_internal_error(api, capsys):
+    def broken(*args):
+        raise RuntimeError("falhou")
+    api.routes['/metricas'] = broken
+    response = request(api, b'GET /metricas HTTP/1.1\r\nConnection: close\r\n\r\n')
+    head, _, body = response.partition(b'\r\n\r\n')
+    assert head.startswith(b'HTTP/1.1 500')
+    assert json.loads(body) == {'erro': "Erro interno"}
+    assert 'RuntimeError' in capsys.readouterr().err
@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from igsest.charts import STATUS_COLORS, create_overview_charts
+from igsest.cube import CUBE_KEYS, MetricsCube, count_codes, count_rows
+from igsest.metrics import calculate_metrics
+
+from conftest import sorted_counts
+
+
+def rows_of(partitions):
+    return pd.concat(
+        [part.assign(hospital=h, ciclo=c) for (h, c), part in partitions.items()],
+        ignore_index=True
+    )
+
+
+def test_add_matches_recount(partitions):
+    items = list(partitions.items())
+    cube = MetricsCube.from_rows(rows_of(dict(items[:2])))
+    cube.add(rows_of(dict(items[2:])))
+    expected = MetricsCube.from_rows(rows_of(partitions))
+    pd.testing.assert_frame_equal(sorted_counts(cube.counts), sorted_counts(expected.counts))
+
+
+def test_remove_drops_empty_groups(partitions):
+    rows = rows_of(partitions)
+    cube = MetricsCube.from_rows(rows)
+    gone = rows[rows['hospital'] == 'HUAB']
+    cube.remove(gone)
+    expected = MetricsCube.from_rows(rows[rows['hospital'] != 'HUAB'])
+    pd.testing.assert_frame_equal(sorted_counts(cube.counts), sorted_counts(expected.counts))
+    assert (cube.counts['n'] > 0).all()
+    assert 'HUAB' not in set(cube.counts['hospital'])
+
+
+def test_update_flips_status(partitions):
+    rows = rows_of(partitions)
+    cube = MetricsCube.from_rows(rows)
+    old = rows.iloc[:10]
+    new = old.copy()
+    new['status'] = np.where(old['status'] == 'Conforme', 'Não Conforme', 'Conforme')
+    cube.update(old, new)
+
+    changed = rows.copy()
+    changed.loc[:9, 'status'] = new['status'].to_numpy()
+    expected = MetricsCube.from_rows(changed)
+    pd.testing.assert_frame_equal(sorted_counts(cube.counts), sorted_counts(expected.counts))
+
+
+def test_replace_partition(partitions, checklist):
+    cube = MetricsCube.from_rows(rows_of(partitions))
+    smaller = checklist.iloc[:5]
+    cube.replace_partition('HUOL', '2025', smaller)
+    assert cube.select(hospital=['HUOL'], ciclo=['2025']).counts['n'].sum() == 5
+    assert cube.select(hospital=['HUOL'], ciclo=['2024']).counts['n'].sum() == len(checklist)
+
+
+def test_count_codes_matches_count_rows(partitions):
+    rows = rows_of(partitions)
+    codes, labels = {}, {}
+    for key in CUBE_KEYS:
+        values, uniques = pd.factorize(rows[key].astype(object))
+        codes[key], labels[key] = values, list(uniques)
+    group_codes, n = count_codes(codes, labels)
+    cube = MetricsCube.from_codes(group_codes, labels, n)
+    pd.testing.assert_frame_equal(sorted_counts(cube.counts), sorted_counts(count_rows(rows)))
+
+
+def test_count_codes_skips_missing_keys():
+    labels = {key: ['a', 'b'] for key in CUBE_KEYS}
+    codes = {key: np.array([0, 1, 0]) for key in CUBE_KEYS}
+    codes['status'] = np.array([0, -1, 0])
+    group_codes, n = count_codes(codes, labels)
+    assert n.tolist() == [2]
+    assert all(values.tolist() == [0] for values in group_codes.values())
+
+
+def test_select_and_totals(partitions, checklist):
+    cube = MetricsCube.from_rows(rows_of(partitions))
+    selected = cube.select(hospital=['MEJC-UFRN'], ciclo=['2024'])
+    expected = partitions[('MEJC-UFRN', '2024')]['status'].value_counts()
+    totals = selected.totals('status')
+    assert totals['Conforme'] == expected['Conforme']
+    assert totals['Não Conforme'] == expected['Não Conforme']
+    assert cube.totals('hospital').tolist() == [2 * len(checklist)] * 3
+
+
+def test_metrics_empty_selection_is_nan(partitions):
+    cube = MetricsCube.from_rows(rows_of(partitions)).select(hospital=['inexistente'])
+    metrics = calculate_metrics(cube)
+    assert metrics['total'] == 0
+    assert np.isnan(metrics['taxa_conformidade'])
+    assert metrics['dimensoes'].empty
+
+
+def test_store_cube_matches_rows(store):
+    expected = MetricsCube.from_rows(store.read())
+    pd.testing.assert_frame_equal(sorted_counts(store.cube().counts), sorted_counts(expected.counts))
+    assert store.saved_cube(store.version()) is not None
+
+
+def test_append_updates_cube(store, checklist):
+    store.append(checklist.iloc[:3], 'HUOL', '2025')
+    assert len(store.read(['HUOL'], ['2025'])) == len(checklist) + 3
+    expected = MetricsCube.from_rows(store.read())
+    pd.testing.assert_frame_equal(sorted_counts(store.cube().counts), sorted_counts(expected.counts))
+
+
+@pytest.mark.parametrize('status', ['Conforme', 'Não Conforme'])
+def test_pie_colors_follow_status(checklist, status):
+    # O status mais frequente vem primeiro; a cor acompanha o rótulo
+    rows = checklist.assign(hospital='HUOL', ciclo='2025', status=status)
+    rows.loc[:2, 'status'] = 'Conforme' if status == 'Não Conforme' else 'Não Conforme'
+    fig_pie, _ = create_overview_charts(MetricsCube.from_rows(rows))
+    pie = fig_pie.data[0]
+    assert list(pie.labels)[0] == status
+    assert list(pie.marker.colors) == [STATUS_COLORS[s] for s in pie.labels]
+
+
+def test_replace_many_counts(partitions, checklist):
+    cube = MetricsCube.from_rows(rows_of(partitions))
+    smaller = checklist.iloc[:5]
+    cube.replace_many_counts({
+        ('HUOL', '2025'): count_rows(smaller.assign(hospital='HUOL', ciclo='2025')),
+        ('HUAB', '2024'): count_rows(smaller.iloc[:0]),
+    })
+    changed = {**partitions, ('HUOL', '2025'): smaller}
+    del changed[('HUAB', '2024')]
+    expected = MetricsCube.from_rows(rows_of(changed))
+    pd.testing.assert_frame_equal(sorted_counts(cube.counts), sorted_counts(expected.counts))
@@ -0,0 +1,61 @@
+import gzip
+import io
+import threading
+
+import pandas as pd
+import pytest
+
+from igsest.cube import MetricsCube
+from igsest.export import DownloadCache, write_download
+
+
+@pytest.fixture(scope='module')
+def frame(checklist):
+    # Colunas categóricas, como as montadas sobre os códigos compactos
+    return checklist
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'csv.gz', 'parquet'])
+def test_write_download_round_trip(tmp_path, frame, fmt):
+    path = tmp_path / f"dados.{fmt}"
+    write_download(frame, fmt, str(path), chunk_size=7)
+    if fmt == 'parquet':
+        back = pd.read_parquet(path)
+    else:
+        raw = path.read_bytes()
+        back = pd.read_csv(io.BytesIO(gzip.decompress(raw) if fmt == 'csv.gz' else raw), dtype=str)
+    pd.testing.assert_frame_equal(back.astype(object), frame.astype(object).reset_index(drop=True))
+
+
+def test_write_excel_sheets(tmp_path, frame, checklist):
+    path = tmp_path / 'relatorio.xlsx'
+    write_download(frame, 'xlsx', str(path), MetricsCube.from_rows(checklist.assign(hospital='H', ciclo='C')))
+    sheets = pd.read_excel(path, sheet_name=None)
+    assert list(sheets) == ['Conformidades', 'Resumo_Dimensoes', 'Nao_Conformidades']
+    assert len(sheets['Conformidades']) == len(frame)
+    assert sheets['Resumo_Dimensoes']['Total'].sum() == len(frame)
+
+
+def test_download_cache_generates_once(tmp_path, frame):
+    cache = DownloadCache(str(tmp_path / 'downloads'), max_files=2)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.read('chave', 'csv', frame)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.stats() == {'hits': 7, 'misses': 1}
+    assert len(set(results)) == 1 and results[0].startswith(b'quest')
+
+
+def test_download_cache_prunes_oldest(tmp_path, frame):
+    directory = tmp_path / 'downloads'
+    cache = DownloadCache(str(directory), max_files=2)
+    for key in ('a', 'b', 'c'):
+        cache.get(key, 'csv', frame.iloc[:3])
+    assert sorted(p.name for p in directory.iterdir()) == ['b.csv', 'c.csv']
+    cache.read('a', 'csv', frame.iloc[:3])
+    assert cache.stats()['misses'] == 4
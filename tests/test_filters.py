@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from igsest.filters import FILTER_COLUMNS, FilterIndex
+
+
+@pytest.fixture(scope='module')
+def frame(partitions):
+    return pd.concat(partitions.values(), ignore_index=True)
+
+
+def test_options_follow_first_appearance(frame):
+    index = FilterIndex(frame)
+    for column in FILTER_COLUMNS:
+        assert index.options(column) == list(frame[column].dropna().unique())
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_mask_matches_isin(frame, seed):
+    rng = np.random.default_rng(seed)
+    index = FilterIndex(frame)
+    selections = {}
+    expected = np.ones(len(frame), dtype=bool)
+    for column in FILTER_COLUMNS:
+        options = index.options(column)
+        chosen = [v for v in options if rng.random() < 0.5]
+        if rng.random() < 0.3:
+            chosen.append('valor inexistente')
+        selections[column] = chosen
+        expected &= frame[column].isin(chosen).to_numpy()
+    np.testing.assert_array_equal(index.mask(**selections), expected)
+    assert len(index.filter(frame, **selections)) == expected.sum()
+
+
+def test_filter_without_restriction_returns_frame(frame):
+    index = FilterIndex(frame)
+    everything = {column: index.options(column) for column in FILTER_COLUMNS}
+    assert index.filter(frame, **everything) is frame
+    assert not index.mask(status=[]).any()
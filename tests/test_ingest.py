@@ -0,0 +1,134 @@
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from igsest.cube import MetricsCube
+from igsest.datasource import BUNDLED_CHECKLIST, read_rows
+from igsest.ingest import find_files, main, partition_of
+from igsest.schema import validate
+from igsest.shared import open_shared
+from igsest.store import LOAD_FILE, LOAD_TIMEOUT, ComplianceStore
+from igsest.versions import DataVersions
+
+from conftest import sorted_counts
+
+
+def test_partition_of():
+    assert partition_of('dir/HUOL_2025.xlsx') == ('HUOL', '2025')
+    assert partition_of('dir/HU_LW_2024.csv') == ('HU_LW', '2024')
+    assert partition_of('dir/HUOL.xlsx', ciclo='2025') == ('HUOL', '2025')
+    with pytest.raises(ValueError):
+        partition_of('dir/HUOL.xlsx')
+
+
+def test_find_files_skips_hidden_and_unknown(tmp_path):
+    for name in ('A_2025.csv', 'B_2025.xlsx', '.oculto.csv', '~$B_2025.xlsx', 'notas.txt'):
+        (tmp_path / name).write_text('')
+    assert [os.path.basename(p) for p in find_files([str(tmp_path)])] == ['A_2025.csv', 'B_2025.xlsx']
+
+
+def test_validate_reports_lines():
+    rows = read_rows(BUNDLED_CHECKLIST)
+    questions = set(rows['questão'])
+    assert validate(rows, questions) == []
+
+    bad = rows.copy()
+    bad.loc[0, 'status'] = 'Talvez'
+    bad.loc[1, 'questão'] = 'X1'
+    bad.loc[2, 'questão'] = bad.loc[3, 'questão']
+    bad.loc[4, 'dimensão'] = ''
+    errors = validate(bad, questions)
+    assert errors[0].startswith('linha 2: status')
+    assert errors[1] == "linha 3: questão inválida 'X1'"
+    assert any(e.startswith('linha 5: questão') and 'repetida' in e for e in errors)
+    assert "linha 6: 'dimensão' vazio" in errors
+    assert validate(rows.assign(questão='Q999'), questions)[0] == "linha 2: questão 'Q999' não existe no checklist"
+
+
+@pytest.fixture
+def files(tmp_path, checklist):
+    directory = tmp_path / 'questionarios'
+    directory.mkdir()
+    checklist.to_csv(directory / 'HUOL_2025.csv', index=False)
+    checklist.iloc[:20].to_csv(directory / 'HUAB_2025.csv', index=False)
+    return directory
+
+
+def test_ingest_writes_partitions_and_cube(tmp_path, files, checklist):
+    root = str(tmp_path / 'armazem')
+    assert main([str(files), '--armazem', root, '--workers', '2']) == 0
+
+    store = ComplianceStore(root)
+    assert store.partitions() == [('HUAB', '2025'), ('HUOL', '2025')]
+    assert len(store.read(['HUOL'])) == len(checklist)
+    # O cubo foi gravado com a versão nova e a marca de carga saiu
+    assert store.saved_cube(store.version()) is not None
+    assert not store.is_loading()
+    expected = MetricsCube.from_rows(store.read())
+    pd.testing.assert_frame_equal(sorted_counts(store.cube().counts), sorted_counts(expected.counts))
+    # Nenhum temporário da carga fica para trás
+    assert not [name for _, _, names in os.walk(root) for name in names if name.endswith('.tmp')]
+
+
+def test_ingest_check_only_writes_nothing(tmp_path, files):
+    root = str(tmp_path / 'armazem')
+    assert main([str(files), '--armazem', root, '--verificar']) == 0
+    assert ComplianceStore(root).partitions() == []
+
+
+def test_ingest_rejects_invalid_file(tmp_path, files, checklist, capsys):
+    bad = checklist.astype(object)
+    bad.loc[0, 'prioridade'] = 'Urgente'
+    bad.to_csv(files / 'MEJC_2025.csv', index=False)
+    root = str(tmp_path / 'armazem')
+
+    assert main([str(files), '--armazem', root, '--workers', '2']) == 1
+    assert 'MEJC_2025.csv: 1 problema(s)' in capsys.readouterr().err
+    store = ComplianceStore(root)
+    assert ('MEJC', '2025') not in store.partitions()
+    assert set(store.cube().counts['hospital']) == {'HUAB', 'HUOL'}
+
+
+@pytest.mark.parametrize('workers', ['0', '-1', 'dois'])
+def test_ingest_rejects_bad_workers(tmp_path, files, workers, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(files), '--armazem', str(tmp_path / 'armazem'), '--workers', workers])
+    assert exit_info.value.code == 2
+    assert '--workers' in capsys.readouterr().err
+
+
+def test_ingest_without_cpu_count(tmp_path, files, monkeypatch):
+    monkeypatch.setattr(os, 'cpu_count', lambda: None)
+    assert main([str(files), '--armazem', str(tmp_path / 'armazem'), '--verificar']) == 0
+
+
+def test_readers_wait_for_batch(store, checklist):
+    versions = DataVersions(store, interval=0)
+    antiga = versions.active()
+    opened = []
+    reader = threading.Thread(target=lambda: opened.append(open_shared(store)[0]))
+    with store.loading():
+        store.write(checklist, 'HUNOVO', '2024')
+        # A troca de versão espera a carga terminar
+        assert versions.check(force=True) is None
+        reader.start()
+        time.sleep(0.3)
+        assert opened == []
+        store.write(checklist, 'HUNOVO', '2025')
+    reader.join(10)
+    assert not store.is_loading()
+    assert opened == [store.version()]
+    assert versions.active() is antiga
+
+
+def test_stale_load_marker_is_ignored(store):
+    path = os.path.join(store.root, LOAD_FILE)
+    with open(path, 'w') as f:
+        f.write('0')
+    assert store.is_loading()
+    old = time.time() - LOAD_TIMEOUT - 1
+    os.utime(path, (old, old))
+    assert not store.is_loading()
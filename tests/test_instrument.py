@@ -0,0 +1,46 @@
+import json
+import time
+
+from igsest.instrument import RerunLog, RerunProfile
+
+
+def test_profile_spans_accumulate():
+    profile = RerunProfile()
+    with profile.span('dados'):
+        time.sleep(0.01)
+    with profile.span('dados'):
+        time.sleep(0.01)
+    with profile.span('graficos'):
+        pass
+    summary = profile.finish()
+    assert set(summary['spans']) == {'dados', 'graficos'}
+    assert summary['spans']['dados'] >= 0.02
+    assert summary['total'] >= sum(summary['spans'].values())
+    assert summary['profile'] is None
+
+
+def test_profile_span_records_on_error():
+    profile = RerunProfile()
+    try:
+        with profile.span('falha'):
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert 'falha' in profile.finish()['spans']
+
+
+def test_cprofile_text():
+    profile = RerunProfile(profile=True)
+    sorted(range(1000))
+    summary = profile.finish(top=5)
+    assert 'cumulative' in summary['profile']
+
+
+def test_log_keeps_slowest_and_exports_json():
+    log = RerunLog(maxlen=3)
+    for total in (0.1, 0.5, 0.2, 0.3):
+        log.append({'total': total, 'spans': {}})
+    assert [s['total'] for s in log.items()] == [0.5, 0.2, 0.3]
+    assert [s['total'] for s in log.slowest(2)] == [0.5, 0.3]
+    data = json.loads(log.to_json(versao='abc'))
+    assert data['versao'] == 'abc' and len(data['reruns']) == 3
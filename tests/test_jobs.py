@@ -0,0 +1,63 @@
+import io
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from igsest.jobs import DONE, FAILED, ExportJobs
+from igsest.shared import open_shared
+
+from conftest import wait_for
+
+
+@pytest.fixture
+def jobs(tmp_path):
+    jobs = ExportJobs(str(tmp_path / 'exportacoes'), max_workers=1, ttl=60)
+    yield jobs
+    jobs._pool.shutdown()
+
+
+def finished(jobs, job_id):
+    wait_for(lambda: jobs.status(job_id)['status'] in (DONE, FAILED), timeout=60)
+    return jobs.status(job_id)
+
+
+def test_export_selection(jobs, store, checklist):
+    versao, _, _ = open_shared(store)
+    job_id = jobs.submit(store, versao, ['HUOL'], ['2025'], 'csv')
+    # Pedido igual reaproveita o job
+    assert jobs.submit(store, versao, ['HUOL'], ['2025'], 'csv') == job_id
+
+    status = finished(jobs, job_id)
+    assert status['status'] == DONE and status['error'] is None
+    with open(status['path'], 'rb') as f:
+        df = pd.read_csv(io.BytesIO(f.read()), dtype=str)
+    assert len(df) == len(checklist)
+    assert set(df['hospital']) == {'HUOL'}
+
+
+def test_unpublished_version_fails(jobs, store):
+    status = finished(jobs, jobs.submit(store, 'antiga', ['HUOL'], ['2025'], 'csv'))
+    assert status['status'] == FAILED
+    assert 'antiga' in status['error']
+    assert status['path'] is None
+
+
+def test_evict_expired(jobs, store):
+    versao, _, _ = open_shared(store)
+    job_id = jobs.submit(store, versao, ['HUAB'], ['2024'], 'csv')
+    path = finished(jobs, job_id)['path']
+
+    # Arquivo deixado por um processo anterior, sem job
+    stray = os.path.join(jobs.directory, 'antigo.csv')
+    with open(stray, 'w') as f:
+        f.write('x')
+    os.utime(stray, (time.time() - 120, time.time() - 120))
+
+    assert jobs.evict_expired() == 0
+    assert not os.path.exists(stray) and os.path.exists(path)
+
+    assert jobs.evict_expired(now=time.time() + 120) == 1
+    assert jobs.status(job_id) is None
+    assert os.listdir(jobs.directory) == []
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from igsest.matrix import NAO_AVALIADA, StatusMatrix
+
+from conftest import CICLOS, HOSPITAIS
+
+
+@pytest.fixture
+def matrix(store):
+    return StatusMatrix.from_compact(store.read_compact())
+
+
+def test_matrix_cells_match_rows(matrix, rows):
+    assert matrix.status.shape == (rows['questão'].nunique(), len(HOSPITAIS), len(CICLOS))
+    assert matrix.questions[:3] == sorted(rows['questão'].unique(), key=lambda q: int(q[1:]))[:3]
+    assert (matrix.status != NAO_AVALIADA).all()
+    q, h, c = matrix.questions.index('Q4'), matrix.hospitals.index('HUOL'), matrix.ciclos.index('2025')
+    row = rows[(rows['questão'] == 'Q4') & (rows['hospital'] == 'HUOL') & (rows['ciclo'] == '2025')]
+    assert matrix.status[q, h, c] == (0 if row['status'].iloc[0] == 'Conforme' else 1)
+
+
+def test_question_rates_match_groupby(matrix, rows):
+    rates = matrix.question_rates(hospitais=['HUAB', 'HUOL']).set_index('questão')
+    selected = rows[rows['hospital'].isin(['HUAB', 'HUOL'])]
+    expected = selected.groupby('questão')['status'].agg(
+        avaliacoes='size', conformes=lambda s: int((s == 'Conforme').sum())
+    )
+    assert rates.loc[expected.index, 'avaliacoes'].tolist() == expected['avaliacoes'].tolist()
+    assert rates.loc[expected.index, 'conformes'].tolist() == expected['conformes'].tolist()
+    taxa = (expected['conformes'] / expected['avaliacoes'] * 100).round(1)
+    np.testing.assert_allclose(rates.loc[expected.index, 'taxa_conformidade'], taxa)
+
+
+def test_cooccurrence_matches_brute_force(matrix, rows):
+    bad = rows[rows['status'] == 'Não Conforme']
+    sets = bad.groupby('questão')[['hospital', 'ciclo']].apply(lambda g: set(map(tuple, g.to_numpy())))
+    counts = matrix.cooccurrence()
+    for a, b in [('Q4', 'Q2'), ('Q4', 'Q4'), (matrix.questions[0], matrix.questions[-1])]:
+        assert counts.loc[a, b] == len(sets.get(a, set()) & sets.get(b, set()))
+
+    pairs = matrix.cooccurring_pairs(k=5)
+    assert pairs['juntas'].is_monotonic_decreasing
+    first = pairs.iloc[0]
+    a, b = sets[first['questão_a']], sets[first['questão_b']]
+    assert first['juntas'] == len(a & b)
+    assert first['jaccard'] == round(len(a & b) / len(a | b) * 100, 1)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from igsest.ranking import GERAL, NetworkRanking, top_k
+
+from conftest import HOSPITAIS
+
+
+def test_top_k_matches_sort():
+    values = np.random.default_rng(1).integers(0, 50, 200)
+    assert sorted(values[top_k(values, 10)], reverse=True) == sorted(values, reverse=True)[:10]
+    assert sorted(values[top_k(values, 10, largest=False)]) == sorted(values)[:10]
+
+
+def test_top_k_puts_nan_last():
+    values = [np.nan, 3.0, 1.0, np.nan, 2.0]
+    assert top_k(values, 4).tolist() == [1, 4, 2, 0]
+    assert top_k(values, 4, largest=False).tolist() == [2, 4, 1, 0]
+    assert top_k(values, 0).tolist() == []
+
+
+@pytest.fixture
+def ranking(store):
+    return NetworkRanking(store.cube(), '2025', padrao=50)
+
+
+def test_rates_match_rows(ranking, rows):
+    assert ranking.hospitals == HOSPITAIS
+    assert ranking.dimensions[-1] == GERAL
+    for hospital in HOSPITAIS:
+        selected = rows[(rows['hospital'] == hospital) & (rows['ciclo'] == '2025')]
+        assert ranking.rates.loc[hospital, GERAL] == pytest.approx((selected['status'] == 'Conforme').mean() * 100)
+        dimension = selected['dimensão'].iloc[0]
+        in_dimension = selected[selected['dimensão'] == dimension]
+        assert ranking.rates.loc[hospital, dimension] == pytest.approx(
+            (in_dimension['status'] == 'Conforme').mean() * 100
+        )
+
+
+def test_top_positions_and_standard(ranking):
+    rates = ranking.rates[GERAL]
+    best = ranking.top(2)
+    assert best['hospital'].tolist() == rates.sort_values(ascending=False).index[:2].tolist()
+    assert ranking.top(1, worst=True)['hospital'].iloc[0] == rates.idxmin()
+    assert best['distancia_padrao'].tolist() == pytest.approx((best['taxa'] - 50).tolist())
+
+    assert ranking.position(rates.idxmax()) == (1, len(HOSPITAIS))
+    assert ranking.position('inexistente') == (None, len(HOSPITAIS))
+    assert ranking.above_standard() == int((rates >= 50).sum())
+    assert ranking.percentiles[GERAL].between(0, 100).all()
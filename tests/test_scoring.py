@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from igsest.metrics import calculate_metrics
+from igsest.scoring import PESOS_FONTE, WeightedScores, WeightProfile, fonte_categories
+
+from conftest import HOSPITAIS
+
+
+def manual_score(rows, profile):
+    prio = rows['prioridade'].astype(object).map(profile.prioridade)
+    fonte = rows['fonte'].astype(object).map(
+        lambda f: max((profile.fonte[c] for c in fonte_categories(f)), default=1.0)
+    )
+    weights = prio * fonte
+    total = weights.sum()
+    return weights[rows['status'] == 'Conforme'].sum() / total * 100 if total else float('nan')
+
+
+def test_fonte_categories():
+    assert fonte_categories("IG-Sest e Lei nº 13.303/2016") == ['Legislação', 'IG-SEST']
+    assert fonte_categories("Boas práticas") == ['Boas práticas']
+    assert fonte_categories(None) == []
+
+
+@pytest.mark.parametrize('prioridade', [None, {'Alta': 10.0, 'Média': 0.0}])
+def test_weighted_score_matches_manual(store, rows, prioridade):
+    scores = WeightedScores(store.cube())
+    profile = WeightProfile(prioridade)
+    selected = rows[(rows['hospital'] == 'HUOL') & (rows['ciclo'] == '2025')]
+    assert scores.score(profile, ['HUOL'], ['2025']) == pytest.approx(manual_score(selected, profile))
+
+    by_hospital = scores.by_hospital(profile, '2024')
+    for hospital in HOSPITAIS:
+        selected = rows[(rows['hospital'] == hospital) & (rows['ciclo'] == '2024')]
+        assert by_hospital[hospital] == pytest.approx(manual_score(selected, profile))
+
+
+def test_equal_weights_give_simple_rate(store):
+    profile = WeightProfile({p: 1.0 for p in ('Alta', 'Média', 'Baixa')}, {f: 1.0 for f in PESOS_FONTE})
+    cube = store.cube()
+    simple = calculate_metrics(cube.select(ciclo=['2025']))['taxa_conformidade']
+    assert WeightedScores(cube).score(profile, ciclos=['2025']) == pytest.approx(simple)
+
+
+def test_zero_weights_give_nan(store):
+    zeros = WeightProfile({p: 0.0 for p in ('Alta', 'Média', 'Baixa')})
+    scores = WeightedScores(store.cube())
+    assert np.isnan(scores.score(zeros))
+    assert scores.by_hospital(zeros, '2025').empty
@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from igsest.cube import MetricsCube
+from igsest.shared import SHARED_DIR, SharedData, open_shared
+from igsest.store import COLUMNS, PARTITION_KEYS
+from igsest.versions import VersionData
+
+from conftest import sorted_counts
+
+
+def as_text(df):
+    return df.astype(object).where(df.notna(), None).reset_index(drop=True)
+
+
+def test_shared_round_trip(store):
+    versao, compact, cube = open_shared(store)
+    assert versao == store.version()
+    pd.testing.assert_frame_equal(
+        as_text(compact.frame(PARTITION_KEYS + COLUMNS)),
+        as_text(store.read()[PARTITION_KEYS + COLUMNS])
+    )
+    pd.testing.assert_frame_equal(sorted_counts(cube.counts), sorted_counts(store.cube().counts))
+
+    # Códigos e contagens ficam mapeados do disco, sem cópia
+    assert all(isinstance(values, np.memmap) for values in compact.codes.values())
+    assert isinstance(cube.counts['n'].array.to_numpy().base, np.memmap)
+
+
+def test_shared_publishes_maintained_cube(store):
+    # O cubo publicado é o que o armazém mantém, não uma recontagem
+    cube = store.cube()
+    cube.counts.loc[0, 'n'] += 1000
+    store._save_cube(cube)
+    _, _, shared = open_shared(store)
+    assert shared.counts['n'].sum() == store.cube().counts['n'].sum()
+
+
+def test_shared_recounts_stale_cube(store, checklist):
+    # Partição nova gravada sem passar pelo cubo: a marca dele fica para trás
+    store._write_partition(checklist, 'HUNOVO', '2025')
+    assert store.saved_cube(store.version()) is None
+    _, _, cube = open_shared(store)
+    assert cube.select(hospital=['HUNOVO']).counts['n'].sum() == len(checklist)
+    pd.testing.assert_frame_equal(
+        sorted_counts(cube.counts), sorted_counts(MetricsCube.from_rows(store.read()).counts)
+    )
+    # O armazém também reconstrói o seu
+    assert 'HUNOVO' in set(store.cube().counts['hospital'])
+
+
+def test_unpublished_version_opens_current(store, checklist):
+    antiga = store.version()
+    store.write(checklist, 'HUNOVO', '2025')
+    # A versão antiga nunca foi publicada: abre a atual, com o nome dela
+    data = VersionData.open(store, antiga)
+    assert data.versao == store.version() != antiga
+    assert 'HUNOVO' in data.hospitals()
+
+
+def test_publish_keeps_recent_versions(store, partitions):
+    shared = SharedData(os.path.join(store.root, SHARED_DIR))
+    first, _, _ = open_shared(store)
+    store.write(partitions[('HUAB', '2025')], 'HUAB', '2024')
+    second, _, _ = open_shared(store)
+    store.write(partitions[('HUOL', '2025')], 'HUOL', '2024')
+    third, _, _ = open_shared(store)
+
+    assert third == store.version()
+    assert shared.exists(second) and shared.exists(third)
+    assert not shared.exists(first)
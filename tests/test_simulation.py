@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from igsest.cube import MetricsCube
+from igsest.metrics import calculate_metrics
+from igsest.simulation import RemediationPlan
+
+
+@pytest.fixture
+def plan(store, rows):
+    selected = rows[rows['hospital'].isin(['HUAB', 'MEJC-UFRN'])]
+    cube = store.cube().select(hospital=['HUAB', 'MEJC-UFRN'])
+    return RemediationPlan(cube, selected), selected
+
+
+def test_plan_starts_at_current_metrics(plan, store):
+    plan, _ = plan
+    current = calculate_metrics(store.cube().select(hospital=['HUAB', 'MEJC-UFRN']))
+    assert plan.total == current['total']
+    assert plan.conformes == current['conformes']
+    assert plan.rate == pytest.approx(current['taxa_conformidade'])
+
+
+def test_plan_matches_recount(plan):
+    plan, selected = plan
+    chosen = plan.candidates()[:5]
+    plan.set_resolved(chosen)
+
+    fixed = selected.copy()
+    fixed['status'] = fixed['status'].astype(object).where(~fixed['questão'].isin(chosen), 'Conforme')
+    expected = calculate_metrics(MetricsCube.from_rows(fixed))
+    simulated = plan.metrics()
+    assert simulated['conformes'] == expected['conformes']
+    assert simulated['taxa_conformidade'] == pytest.approx(expected['taxa_conformidade'])
+    pd.testing.assert_frame_equal(
+        simulated['dimensoes'].astype(float), expected['dimensoes'].astype(float), check_names=False
+    )
+    assert calculate_metrics(plan.cube())['conformes'] == expected['conformes']
+
+
+def test_plan_toggle_round_trip(plan):
+    plan, _ = plan
+    base = plan.counts.copy()
+    question = plan.candidates()[0]
+    plan.toggle(question)
+    plan.toggle(question)  # repetir não soma de novo
+    assert plan.resolved == {question}
+    plan.toggle(question, resolved=False)
+    np.testing.assert_array_equal(plan.counts, base)
+    assert plan.conformes == int(base[0::2].sum())
+
+
+def test_plan_candidates_by_priority_and_needed(plan):
+    plan, _ = plan
+    order = [plan.priority(q) for q in plan.candidates()]
+    ranks = {'Alta': 0, 'Média': 1, 'Baixa': 2}
+    assert [ranks[p] for p in order] == sorted(ranks[p] for p in order)
+
+    needed = plan.needed(padrao=80)
+    assert (plan.conformes + needed) / plan.total * 100 >= 80
+    assert (plan.conformes + needed - 1) / plan.total * 100 < 80
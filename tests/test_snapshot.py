@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from igsest.metrics import calculate_metrics
+from igsest.snapshot import ViewSnapshot, default_view, load_snapshot, main, snapshot_path, view_snapshot
+from igsest.store import ComplianceStore
+from igsest.versions import VersionData
+
+
+@pytest.fixture
+def data(store):
+    return VersionData.open(store, store.version())
+
+
+def test_default_view(data):
+    assert default_view(data) == (['MEJC-UFRN'], ['2025'])
+
+
+def test_snapshot_matches_live_metrics(store, data):
+    snapshot = load_snapshot(store, data)
+    path = snapshot_path(store, data.versao)
+    assert os.path.exists(path)
+    assert snapshot.versao == data.versao
+
+    live = calculate_metrics(data.cube.select(hospital=['MEJC-UFRN'], ciclo=['2025']))
+    for key in ('total', 'conformes', 'taxa_conformidade'):
+        assert snapshot.metrics[key] == pytest.approx(live[key])
+    assert snapshot.metrics['dimensoes']['total'].tolist() == live['dimensoes']['total'].tolist()
+
+    # Segunda leitura vem do disco, com o mesmo conteúdo
+    again = load_snapshot(store, data)
+    assert again.payload == ViewSnapshot.read(path).payload
+    assert again.metrics['total'] == snapshot.metrics['total']
+
+
+def test_snapshot_filters_and_figures(store, data):
+    snapshot = view_snapshot(store, data)
+    assert view_snapshot(store, data) is snapshot
+    filters = snapshot.filters
+    assert snapshot.matches(hospital=['MEJC-UFRN'], ciclo=['2025'], status=filters['status'])
+    assert not snapshot.matches(hospital=['HUOL'])
+    assert not snapshot.matches(status=filters['status'][:1])
+
+    pie, bar = snapshot.figure('visao_geral')
+    assert pie.data[0].type == 'pie' and bar.data
+    # Figuras remontadas uma vez e compartilhadas
+    assert snapshot.figure('prioridades') is snapshot.figure('prioridades')
+
+
+def test_empty_store_has_no_snapshot(tmp_path):
+    store = ComplianceStore(str(tmp_path / 'vazio'))
+    assert load_snapshot(store, VersionData.open(store, store.version())) is None
+
+
+def test_main_writes_snapshot(store):
+    assert main(['--armazem', store.root]) == 0
+    assert os.path.exists(snapshot_path(store, store.version()))
@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from igsest.store import CICLO_PADRAO, COLUMNS, HOSPITAL_PADRAO, PARTITION_KEYS, ComplianceStore, open_store
+
+from conftest import CICLOS, HOSPITAIS
+
+
+def as_text(df):
+    return df.astype(object).where(df.notna(), None).reset_index(drop=True)
+
+
+def test_partitions_and_labels(store):
+    assert store.partitions() == sorted((h, c) for h in HOSPITAIS for c in CICLOS)
+    assert store.hospitals() == HOSPITAIS
+    assert store.cycles(['HUAB']) == CICLOS
+
+
+def test_read_only_selected_partitions(store, partitions):
+    df = store.read(['HUOL'], ['2025'])
+    assert set(df['hospital']) == {'HUOL'} and set(df['ciclo']) == {'2025'}
+    pd.testing.assert_frame_equal(as_text(df[COLUMNS]), as_text(partitions[('HUOL', '2025')][COLUMNS]))
+
+
+def test_compact_round_trip(store):
+    compact = store.read_compact()
+    pd.testing.assert_frame_equal(
+        as_text(compact.frame(PARTITION_KEYS + COLUMNS)),
+        as_text(store.read()[PARTITION_KEYS + COLUMNS])
+    )
+
+
+def test_compact_select_matches_read(store):
+    compact = store.read_compact().select(hospital=['HUOL'], ciclo=['2025'])
+    pd.testing.assert_frame_equal(
+        as_text(compact.frame(COLUMNS)),
+        as_text(store.read(['HUOL'], ['2025'])[COLUMNS])
+    )
+
+
+def test_version_follows_content(store, partitions):
+    versao = store.version()
+    store.write(partitions[('HUAB', '2024')], 'HUAB', '2024')
+    assert store.version() == versao
+
+    store.write(partitions[('HUAB', '2025')], 'HUAB', '2024')
+    assert store.version() != versao
+
+
+@pytest.mark.parametrize('hospital', ['', '.oculto', 'a/b', 'a=b'])
+def test_invalid_partition_key(tmp_path, checklist, hospital):
+    with pytest.raises(ValueError):
+        ComplianceStore(str(tmp_path)).write(checklist, hospital, '2025')
+
+
+def test_open_store_seeds_bundled_checklist(tmp_path, checklist):
+    store = open_store(str(tmp_path / 'novo'))
+    assert store.partitions() == [(HOSPITAL_PADRAO, CICLO_PADRAO)]
+    assert len(store.read()) == len(checklist)
+
+
+def test_write_partitions(tmp_path, partitions):
+    store = ComplianceStore(str(tmp_path / 'lote'))
+    store.write_partitions(partitions)
+    assert store.partitions() == sorted(partitions)
+    cube = store.saved_cube(store.version())
+    assert cube is not None and cube.counts['n'].sum() == len(store.read())
@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from igsest.table import STATUS_STYLES, TableCursor, page_count, status_styles, style_status
+
+
+@pytest.mark.parametrize('dtype', [object, 'category'])
+def test_status_styles(dtype):
+    values = pd.Series(['Conforme', 'Não Conforme', None, 'Conforme'], dtype=dtype)
+    assert status_styles(values).tolist() == [
+        STATUS_STYLES['Conforme'], STATUS_STYLES['Não Conforme'], '', STATUS_STYLES['Conforme']
+    ]
+
+
+def test_style_status_only_colors_status(checklist):
+    df = checklist[['questão', 'status']].rename(columns={'status': 'Status'}).head(5)
+    css = style_status(df).to_html().split('</style>')[0]
+    for status in df['Status'].unique():
+        assert STATUS_STYLES[status].split(';')[0] in css
+    # Só a coluna de status ganha estilo
+    assert '_col1' in css and '_col0' not in css
+
+
+@pytest.mark.parametrize('rows, expected', [(0, 1), (1, 1), (50, 1), (51, 2), (100, 2)])
+def test_page_count(rows, expected):
+    assert page_count(rows, 50) == expected
+
+
+@pytest.fixture
+def table(checklist):
+    return checklist[['questão', 'descrição', 'prioridade', 'status']].reset_index(drop=True)
+
+
+@pytest.mark.parametrize('dtype', [object, 'category'])
+def test_cursor_search_ignores_case(table, dtype):
+    df = table.astype({'descrição': dtype})
+    text = df['descrição'].iloc[0].split()[0].upper()
+    cursor = TableCursor(df, search=text, search_columns=['questão', 'descrição'])
+    expected = df['descrição'].astype(str).str.contains(text, case=False, regex=False)
+    assert cursor.positions.tolist() == expected[expected].index.tolist()
+
+
+def test_cursor_sorts_categories_in_declared_order(table):
+    cursor = TableCursor(table, sort_by='prioridade')
+    ordered = table['prioridade'].iloc[cursor.positions]
+    assert ordered.cat.codes.is_monotonic_increasing
+    descending = TableCursor(table, sort_by='prioridade', ascending=False)
+    assert table['prioridade'].iloc[descending.positions].cat.codes.is_monotonic_decreasing
+
+
+def test_cursor_pages(table):
+    cursor = TableCursor(table, sort_by='questão')
+    assert cursor.page_count(10) == page_count(len(table), 10)
+    pages = [cursor.page(table, page, 10) for page in range(1, cursor.page_count(10) + 1)]
+    pd.testing.assert_frame_equal(pd.concat(pages), table.iloc[cursor.positions])
+    # Páginas fora do intervalo ficam na primeira ou na última
+    pd.testing.assert_frame_equal(cursor.page(table, 0, 10), pages[0])
+    pd.testing.assert_frame_equal(cursor.page(table, 99, 10), pages[-1])
+    # As posições valem para cópias do mesmo frame
+    pd.testing.assert_frame_equal(cursor.page(table.copy(), 2, 10), pages[1])
+
+
+def test_cursor_without_matches(table):
+    cursor = TableCursor(table, search='nada parecido', search_columns=['descrição'])
+    assert len(cursor) == 0 and cursor.page_count(10) == 1
+    assert cursor.page(table, 1, 10).empty
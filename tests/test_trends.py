@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from igsest.trends import cycle_rates, trend_table
+
+from conftest import CICLOS
+
+
+def test_cycle_rates_match_rows(store, rows):
+    rates = cycle_rates(store.cube(), 'hospital')
+    assert list(rates.columns) == CICLOS
+    selected = rows[(rows['hospital'] == 'HUAB') & (rows['ciclo'] == '2024')]
+    assert rates.loc['HUAB', '2024'] == pytest.approx((selected['status'] == 'Conforme').mean() * 100)
+
+
+def test_moving_average_skips_missing_cycles():
+    gaps = pd.DataFrame([[10.0, np.nan, 20.0, 30.0, np.nan, 40.0]], index=['a'], columns=list('123456'))
+    trend = trend_table(gaps, window=3)
+    assert trend['ciclo'].tolist() == ['1', '3', '4', '6']
+    assert trend['media_movel'].tolist() == [10.0, 15.0, 20.0, 30.0]
+    assert trend['variacao'].iloc[2] == 10.0
+    assert np.isnan(trend['variacao'].iloc[1])
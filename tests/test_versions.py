@@ -0,0 +1,57 @@
+from igsest.versions import DataVersions
+
+from conftest import wait_for
+
+
+def test_versions_swap_after_warming(store, checklist):
+    versions = DataVersions(store, interval=0)
+    switches, warmed = [], []
+    versions.on_switch(lambda nova, antiga: switches.append((nova, antiga)))
+    versions.on_warm(lambda data: warmed.append(data.versao))
+    antiga = versions.active()
+    df, _ = antiga.selection(['HUOL'], ['2025'])
+    assert versions.check() is None
+
+    store.write(checklist, 'HUNOVO', '2025')
+    nova = versions.check(force=True)
+    assert nova == store.version() != antiga.versao
+    wait_for(lambda: versions.warming() is None)
+
+    atual = versions.active()
+    assert atual.versao == nova
+    assert warmed == [nova]
+    assert switches == [(nova, antiga.versao)]
+    assert 'HUNOVO' in atual.hospitals()
+    assert atual.cube.select(hospital=['HUNOVO']).counts['n'].sum() == len(checklist)
+    # A seleção usada na versão antiga já vem aquecida na nova
+    assert atual.hits == 0 and atual.misses == 1
+    # Quem ainda segura a versão antiga continua lendo os mesmos dados
+    assert 'HUNOVO' not in antiga.hospitals()
+    assert len(df) == len(checklist)
+
+
+def test_warm_failure_keeps_active(store, checklist):
+    versions = DataVersions(store, interval=0)
+    antiga = versions.active()
+
+    def fail(data):
+        raise RuntimeError("sem memória")
+    versions.on_warm(fail)
+
+    store.write(checklist, 'HUNOVO', '2025')
+    versions.check(force=True)
+    wait_for(lambda: versions.warming() is None)
+    assert versions.active() is antiga
+    assert versions.last_error == "RuntimeError: sem memória"
+
+
+def test_selection_and_derived_cache(store):
+    data = DataVersions(store).active()
+    first = data.selection(['HUOL', 'HUAB'], ['2025'])
+    assert data.selection(['HUAB', 'HUOL'], ['2025']) is first
+    assert data.stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+    calls = []
+    build = lambda: calls.append(1) or len(calls)
+    assert data.cached('chave', build) == data.cached('chave', build) == 1
+    assert data.partitions == store.partitions()